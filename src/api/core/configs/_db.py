@@ -49,9 +49,19 @@ class DbConfig(BaseConfig):
     )  # pool_size + max_overflow = max number of pools allowed
     pool_recycle: int = Field(..., ge=-1, le=86_400)  # 3 hours, -1 means no timeout
     pool_timeout: int = Field(..., ge=0, le=3600)  # 30 seconds
+    pool_pre_ping: bool = Field(default=True)
+    query_cache_size: int = Field(default=1200, ge=0, le=100_000)  # 0 means disabled
+    prepare_threshold: Optional[int] = Field(default=1, ge=0, le=100)  # None means disabled
     select_limit: int = Field(..., ge=1, le=100_000)
     select_max_limit: int = Field(..., ge=1, le=10_000_000)
     select_is_desc: bool = Field(...)
+    ids_chunk_size: int = Field(default=500, ge=1, le=100_000)
+    delete_batch_size: int = Field(default=10_000, ge=1, le=1_000_000)
+    bulk_batch_size: int = Field(default=1000, ge=1, le=100_000)
+    copy_threshold: Optional[int] = Field(default=None, ge=1, le=10_000_000)  # None means disabled
+    allow_truncate: bool = Field(default=False)
+    use_app_updated_at: bool = Field(default=False)
+    row_count_cache_ttl: float = Field(default=5.0, ge=0, le=3600)  # 0 means disabled
 
     model_config = SettingsConfigDict(env_prefix=ENV_PREFIX_DB)
 
@@ -9,7 +9,13 @@ from pydantic_settings import SettingsConfigDict
 from beans_logging import LoggerConfigPM
 
 from api.__version__ import __version__
-from api.core.constants import EnvEnum, ENV_PREFIX, ENV_PREFIX_API, ENV_PREFIX_DB
+from api.core.constants import (
+    EnvEnum,
+    PROD_ENVS,
+    ENV_PREFIX,
+    ENV_PREFIX_API,
+    ENV_PREFIX_DB,
+)
 from ._base import FrozenBaseConfig
 from ._db import DbConfig, FrozenDbConfig
 from ._dev import DevConfig, FrozenDevConfig
@@ -97,7 +103,7 @@ class MainConfig(FrozenBaseConfig):
             # f"{ENV_PREFIX_API}SECURITY_JWT_SECRET",
         ]
 
-        if (self.env == EnvEnum.STAGING) or (self.env == EnvEnum.PRODUCTION):
+        if self.env in PROD_ENVS:
             for _required_env in _required_envs:
                 if _required_env not in os.environ:
                     raise ValueError(
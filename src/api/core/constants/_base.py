@@ -18,6 +18,10 @@ class EnvEnum(str, Enum):
     PRODUCTION = "PRODUCTION"
 
 
+## Production-like environments (required envs are checked):
+PROD_ENVS = frozenset({EnvEnum.STAGING, EnvEnum.PRODUCTION})
+
+
 class WarnEnum(str, Enum):
     ERROR = "ERROR"
     ALWAYS = "ALWAYS"
@@ -56,6 +60,7 @@ __all__ = [
     "ENV_PREFIX_API",
     "ENV_PREFIX_DB",
     "EnvEnum",
+    "PROD_ENVS",
     "WarnEnum",
     "LanguageEnum",
     "CurrencyEnum",
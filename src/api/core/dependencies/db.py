@@ -20,14 +20,8 @@ async def async_get_write() -> AsyncGenerator[AsyncSession, None]:
         AsyncGenerator[AsyncSession, None]: SQLAlchemy async session.
     """
 
-    # async with AsyncWriteSession() as _async_write_session:
-    #     yield _async_write_session
-
-    _async_write_session: AsyncSession = AsyncWriteSession()
-    try:
+    async with AsyncWriteSession() as _async_write_session:
         yield _async_write_session
-    finally:
-        await _async_write_session.close()
 
 
 async def async_get_read() -> AsyncGenerator[AsyncSession, None]:
@@ -37,14 +31,8 @@ async def async_get_read() -> AsyncGenerator[AsyncSession, None]:
         AsyncGenerator[AsyncSession, None]: SQLAlchemy async session.
     """
 
-    # async with AsyncReadSession() as _async_read_session:
-    #     yield _async_read_session
-
-    _async_read_session: AsyncSession = AsyncReadSession()
-    try:
+    async with AsyncReadSession() as _async_read_session:
         yield _async_read_session
-    finally:
-        await _async_read_session.close()
 
 
 # def get_write() -> Session:
@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 
 from ._base import *
+from ._translate import *
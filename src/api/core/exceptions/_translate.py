@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from sqlalchemy.exc import NoResultFound
+
+from api.core.constants import ErrorCodeEnum
+
+from ._base import BaseHTTPException, EmptyValueError, NullConstraintError
+
+
+## Error code, message and description templates per database/service error:
+_DB_ERROR_TEMPLATES: Dict[
+    Type[Exception], Tuple[ErrorCodeEnum, str, Optional[str]]
+] = {
+    NoResultFound: (
+        ErrorCodeEnum.NOT_FOUND,
+        "Not found {resource} with '{id}' ID!",
+        None,
+    ),
+    EmptyValueError: (
+        ErrorCodeEnum.UNPROCESSABLE_ENTITY,
+        "No {resource} data provided!",
+        None,
+    ),
+    NullConstraintError: (
+        ErrorCodeEnum.UNPROCESSABLE_ENTITY,
+        "{Resource} data is missing!",
+        "{Resource}: {err}",
+    ),
+}
+
+
+def translate_db_errors(
+    resource: str,
+    *exceptions: Type[Exception],
+    messages: Optional[Dict[Type[Exception], str]] = None,
+) -> Callable:
+    """Decorator to translate database/service errors of an async service function into `BaseHTTPException`.
+    Messages are prepared with the resource name once when the decorator is applied.
+
+    Args:
+        resource    (str                                 , required): Resource name for error messages (e.g. 'task').
+        *exceptions (Type[Exception]                     , optional): Exception types to translate. Defaults to all known types.
+        messages    (Optional[Dict[Type[Exception], str]], optional): Message templates per exception type to use instead of default ones. Defaults to None.
+
+    Raises:
+        KeyError: If there is no translation template for the given exception type.
+
+    Returns:
+        Callable: Decorator for async service function.
+    """
+
+    _resource_title = resource.capitalize()
+
+    def _prepare(template: Optional[str]) -> Optional[str]:
+        if template is None:
+            return None
+
+        return template.replace("{resource}", resource).replace(
+            "{Resource}", _resource_title
+        )
+
+    _templates: Dict[Type[Exception], Tuple[ErrorCodeEnum, str, Optional[str]]] = {}
+    for _exception in exceptions or tuple(_DB_ERROR_TEMPLATES):
+        _error_enum, _message, _description = _DB_ERROR_TEMPLATES[_exception]
+        if messages and (_exception in messages):
+            _message = messages[_exception]
+
+        _templates[_exception] = (
+            _error_enum,
+            _prepare(_message),
+            _prepare(_description),
+        )
+
+    _catch = tuple(_templates)
+
+    def _decorator(func: Callable) -> Callable:
+        _signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def _wrapper(*args, **kwargs) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except _catch as err:
+                _id = kwargs.get("id")
+                if (_id is None) and ("id" in _signature.parameters):
+                    _id = _signature.bind_partial(*args, **kwargs).arguments.get("id")
+
+                for _exception, _template in _templates.items():
+                    if isinstance(err, _exception):
+                        _error_enum, _message, _description = _template
+                        break
+
+                raise BaseHTTPException(
+                    error_enum=_error_enum,
+                    message=_message.format(id=_id, err=err),
+                    description=(
+                        _description.format(id=_id, err=err) if _description else None
+                    ),
+                )
+
+        return _wrapper
+
+    return _decorator
+
+
+__all__ = ["translate_db_errors"]
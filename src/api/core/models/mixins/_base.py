@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
 
-import json
 from uuid import UUID
 from datetime import datetime
-from typing import Union, List, Dict, Any, Optional, Sequence
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import (
+    Union,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+    Callable,
+    FrozenSet,
+    ClassVar,
+)
 
-from pydantic import validate_call
+import orjson
 from sqlalchemy import (
     BigInteger,
     Uuid,
@@ -20,23 +32,476 @@ from sqlalchemy import (
     Insert,
     Update,
     Delete,
+    delete,
     Subquery,
+    Integer,
+    bindparam,
+    any_,
+    ColumnElement,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import (
     DeclarativeBase,
     declarative_mixin,
     Mapped,
     mapped_column,
     joinedload,
+    Session,
 )
-from sqlalchemy.util import ReadOnlyProperties
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import instance_state
 
 from api.core.constants import WarnEnum
 from api.core import utils
 from api.config import config
+from api.core.exceptions import (
+    PrimaryKeyError,
+    UniqueKeyError,
+    NullConstraintError,
+    ForeignKeyError,
+    CheckConstraintError,
+)
 from api.logger import logger
 
 
+## Sentinel for missing keys, where None is a valid value:
+_MISSING = object()
+
+## Canonical `where` filter operators by their aliases:
+_WHERE_OPS = {
+    "eq": "eq",
+    "equal": "eq",
+    "=": "eq",
+    "==": "eq",
+    "ne": "ne",
+    "not_equal": "ne",
+    "!=": "ne",
+    "like": "like",
+    "gt": "gt",
+    ">": "gt",
+    "ge": "ge",
+    ">=": "ge",
+    "lt": "lt",
+    "<": "lt",
+    "le": "le",
+    "<=": "le",
+    "between": "between",
+}
+
+## `where` filter condition builders by canonical operator (value or bind parameter):
+_WHERE_CLAUSES: Dict[str, Callable[[Any, Any], ColumnElement[bool]]] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "is_null": lambda column, value: column.is_(None),
+    "is_not_null": lambda column, value: column.is_not(None),
+    "like": lambda column, value: column.like(value),
+    "gt": lambda column, value: column > value,
+    "ge": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "le": lambda column, value: column <= value,
+    "between": lambda column, value: column.between(value[0], value[1]),
+}
+
+
+## Foreign key detail table prefix and quotes to replace, prepared once:
+_FK_TABLE_PREFIX = f"table '{config.db.prefix}"
+_QUOTE_TRANS = str.maketrans({'"': "'"})
+
+
+def _clean_fk_detail(detail: str) -> str:
+    """Clean foreign key violation detail message for API error response.
+
+    Args:
+        detail (str, required): Database error detail message.
+
+    Returns:
+        str: Cleaned detail message.
+    """
+
+    return (
+        detail.replace("Key ", "")
+        .translate(_QUOTE_TRANS)
+        .replace(_FK_TABLE_PREFIX, "'")
+    )
+
+
+def _is_pk_constraint(constraint_name: Optional[str]) -> bool:
+    """Check if constraint name is primary key constraint, named by metadata naming
+    convention (`pk__<table>`) or PostgreSQL default (`<table>_pkey`).
+
+    Args:
+        constraint_name (Optional[str], required): Constraint name from error diagnostics.
+
+    Returns:
+        bool: True if primary key constraint.
+    """
+
+    if not constraint_name:
+        return False
+
+    return constraint_name.startswith("pk__") or constraint_name.endswith("_pkey")
+
+
+def _handle_not_null(orig: Exception, pk_message: Optional[str]) -> Exception:
+    """Create `NullConstraintError` for not null violation."""
+
+    return NullConstraintError(f"`{orig.diag.column_name}` cannot be NULL.")
+
+
+def _handle_unique(orig: Exception, pk_message: Optional[str]) -> Exception:
+    """Create `PrimaryKeyError` (if `pk_message` is set) or `UniqueKeyError` for unique violation.
+    Primary key is detected by violated constraint name, instead of parsing detail message.
+    """
+
+    _detail = orig.diag.message_detail.replace("Key ", "")
+    if (pk_message is not None) and _is_pk_constraint(orig.diag.constraint_name):
+        logger.error(pk_message)
+        return PrimaryKeyError(_detail)
+
+    return UniqueKeyError(_detail)
+
+
+def _handle_foreign_key(orig: Exception, pk_message: Optional[str]) -> Exception:
+    """Create `ForeignKeyError` for foreign key violation."""
+
+    return ForeignKeyError(_clean_fk_detail(orig.diag.message_detail))
+
+
+def _handle_check(orig: Exception, pk_message: Optional[str]) -> Exception:
+    """Create `CheckConstraintError` for check violation."""
+
+    return CheckConstraintError(orig.diag.message_detail.replace("Key ", ""))
+
+
+## Handlers by PostgreSQL SQLSTATE code (driver error `sqlstate`), which create API
+## exceptions for integrity errors, without importing driver error classes:
+_SQLSTATE_HANDLERS: Dict[str, Callable[[Exception, Optional[str]], Exception]] = {
+    "23502": _handle_not_null,  # not_null_violation
+    "23505": _handle_unique,  # unique_violation
+    "23503": _handle_foreign_key,  # foreign_key_violation
+    "23514": _handle_check,  # check_violation
+}
+
+
+def _apply_where_shape(
+    stmt: Union[Select, Delete],
+    cls: type,
+    where_shape: Tuple[Tuple[str, str], ...],
+) -> Union[Select, Delete]:
+    """Add `where` filter conditions to statement by filter shape, all filter values are
+    bind parameters named by filter index (`p_where_{i}`, see `BaseMixin._parse_where()`).
+
+    Args:
+        stmt        (Union[Select, Delete]      , required): SQLAlchemy statement.
+        cls         (type                       , required): ORM class.
+        where_shape (Tuple[Tuple[str, str], ...], required): Tuple of (column, canonical operator) pairs.
+
+    Returns:
+        Union[Select, Delete]: Statement with `where` filter conditions.
+    """
+
+    for _i, (_column_name, _op) in enumerate(where_shape):
+        if _op == "between":
+            _param = (bindparam(f"p_where_{_i}_0"), bindparam(f"p_where_{_i}_1"))
+        else:
+            _param = bindparam(f"p_where_{_i}")
+
+        stmt = stmt.where(_WHERE_CLAUSES[_op](getattr(cls, _column_name), _param))
+
+    return stmt
+
+
+def _check_list_arg(name: str, value: Any) -> None:
+    """Check optional list argument type, cheap replacement of `validate_call` for hot-path methods.
+
+    Args:
+        name  (str, required): Argument name for error message.
+        value (Any, required): Argument value.
+
+    Raises:
+        TypeError: If argument value is not None or list-like.
+    """
+
+    if (value is not None) and (not isinstance(value, (list, tuple, set, frozenset))):
+        raise TypeError(f"`{name}` must be a list, got `{type(value).__name__}`!")
+
+
+@lru_cache(maxsize=256)
+def _get_column_keys(cls: type) -> Tuple[str, ...]:
+    """Get mapped column attribute names of ORM class, inspected only once per class.
+
+    Args:
+        cls (type, required): ORM class.
+
+    Returns:
+        Tuple[str, ...]: Tuple of column attribute names.
+    """
+
+    return tuple(_column.key for _column in inspect(cls).column_attrs)
+
+
+@lru_cache(maxsize=256)
+def _get_filterable_columns(cls: type) -> FrozenSet[str]:
+    """Get set of column names which can be used in `where` filter and `order_by` of ORM class.
+
+    Args:
+        cls (type, required): ORM class.
+
+    Returns:
+        FrozenSet[str]: Set of column names.
+    """
+
+    return frozenset(_get_column_keys(cls))
+
+
+@lru_cache(maxsize=256)
+def _get_joinable_relations(cls: type) -> FrozenSet[str]:
+    """Get set of relationship names which can be used in `joins` of ORM class.
+
+    Args:
+        cls (type, required): ORM class.
+
+    Returns:
+        FrozenSet[str]: Set of relationship names.
+    """
+
+    return frozenset(inspect(cls).relationships.keys())
+
+
+@lru_cache(maxsize=256)
+def _get_mapped_attrs(cls: type) -> FrozenSet[str]:
+    """Get all mapped attribute names (columns, relationships, etc.) of ORM class, inspected only once per class.
+
+    Args:
+        cls (type, required): ORM class.
+
+    Returns:
+        FrozenSet[str]: Set of mapped attribute names.
+    """
+
+    return frozenset(inspect(cls).attrs.keys())
+
+
+@lru_cache(maxsize=256)
+def _get_attr_impls(cls: type) -> Dict[str, Any]:
+    """Get attribute implementations (which track changes) of all mapped attributes of ORM class,
+    so values can be set without going through instrumented attribute descriptors.
+
+    Args:
+        cls (type, required): ORM class.
+
+    Returns:
+        Dict[str, Any]: Attribute implementations by attribute name.
+    """
+
+    _class_manager = inspect(cls).class_manager
+    return {
+        _key: _class_manager[_key].impl
+        for _key in _get_mapped_attrs(cls)
+        if (_key in _class_manager) and hasattr(_class_manager[_key], "impl")
+    }
+
+
+@lru_cache(maxsize=256)
+def _get_column_values_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+    """Get getter of all mapped column values of ORM object (in `_get_column_keys()` order),
+    built once per class with `operator` getters to fetch all values in a single C-level call.
+    Already loaded values are read from instance `__dict__` without attribute descriptors,
+    otherwise (expired or deferred columns) through attributes to load them.
+
+    Args:
+        cls (type, required): ORM class.
+
+    Returns:
+        Callable[[Any], Tuple[Any, ...]]: Function to get tuple of column values from ORM object.
+    """
+
+    _column_keys = _get_column_keys(cls)
+    _column_set = frozenset(_column_keys)
+    _get_attrs = attrgetter(*_column_keys)
+    _get_items = itemgetter(*_column_keys)
+    ## Single key getters return the value itself instead of tuple:
+    _is_single = len(_column_keys) == 1
+
+    def _get_values(orm_object: Any) -> Tuple[Any, ...]:
+        _state_dict = orm_object.__dict__
+        if _state_dict.keys() >= _column_set:
+            _values = _get_items(_state_dict)
+        else:
+            _values = _get_attrs(orm_object)
+
+        return (_values,) if _is_single else _values
+
+    return _get_values
+
+
+@lru_cache(maxsize=256)
+def _build_delete_template(
+    cls: type, where_shape: Tuple[Tuple[str, str], ...], returning_ids: bool
+) -> Delete:
+    """Build and cache delete statement template by its `where` filter shape
+    (see `BaseMixin._prepare_delete()`).
+
+    Args:
+        cls           (type                       , required): ORM class.
+        where_shape   (Tuple[Tuple[str, str], ...], required): Tuple of (column, canonical operator) pairs.
+        returning_ids (bool                       , required): Return deleted IDs.
+
+    Returns:
+        Delete: Delete statement template.
+    """
+
+    _stmt: Delete = _apply_where_shape(
+        stmt=delete(cls), cls=cls, where_shape=where_shape
+    )
+    if returning_ids:
+        _stmt = _stmt.returning(cls.id)
+
+    return _stmt
+
+
+@lru_cache(maxsize=256)
+def _build_select_template(
+    cls: type,
+    where_shape: Tuple[Tuple[str, str], ...],
+    order_by: Tuple[str, ...],
+    is_desc: bool,
+    joins: Tuple[str, ...],
+    disable_limit: bool,
+    with_total: bool = False,
+) -> Select:
+    """Build and cache select statement template by its shape, all filter values,
+    offset and limit are bind parameters (see `BaseMixin._prepare_select()`).
+    Reusing the same statement object also reuses its memoized SQL cache key.
+
+    Args:
+        cls           (type                       , required): ORM class.
+        where_shape   (Tuple[Tuple[str, str], ...], required): Tuple of (column, canonical operator) pairs.
+        order_by      (Tuple[str, ...]            , required): Tuple of order by columns.
+        is_desc       (bool                       , required): Is sort descending or ascending.
+        joins         (Tuple[str, ...]            , required): Tuple of joinable relationships.
+        disable_limit (bool                       , required): Disable select limit.
+        with_total    (bool                       , optional): Add total matched rows count column (before limit/offset). Defaults to False.
+
+    Returns:
+        Select: Select statement template.
+    """
+
+    ## Sort direction is picked once and applied to all order by columns:
+    _sort_direct = desc if is_desc else asc
+    _order_cols = [_sort_direct(getattr(cls, _order_by)) for _order_by in order_by]
+    _order_cols.append(_sort_direct(cls.id))
+
+    ## Deffered join to improve performance:
+    # Subquery:
+    _sub_query: Select = select(cls.id)
+    if with_total:
+        # Window function is evaluated before limit/offset:
+        _sub_query = _sub_query.add_columns(func.count().over().label("total_count"))
+
+    _sub_query = _apply_where_shape(
+        stmt=_sub_query, cls=cls, where_shape=where_shape
+    )
+
+    _sub_query: Select = _sub_query.order_by(*_order_cols)
+
+    if not disable_limit:
+        _sub_query = _sub_query.limit(bindparam("p_limit", type_=Integer)).offset(
+            bindparam("p_offset", type_=Integer)
+        )
+
+    # Make into subquery:
+    _sub_query: Subquery = _sub_query.subquery()
+
+    # Main query:
+    _stmt: Select = select(cls).join(_sub_query, cls.id == _sub_query.c.id)
+    if with_total:
+        _stmt = _stmt.add_columns(_sub_query.c.total_count)
+
+    if joins:
+        _stmt = _stmt.options(*[joinedload(getattr(cls, _join)) for _join in joins])
+
+    _stmt = _stmt.order_by(*_order_cols)
+    return _stmt
+
+
+@lru_cache(maxsize=256)
+def _build_select_one_template(
+    cls: type, where_shape: Tuple[Tuple[str, str], ...], joins: Tuple[str, ...]
+) -> Select:
+    """Build and cache single object select statement template by `where` filter shape
+    (see `BaseMixin._prepare_select_one()`), without deferred join subquery and offset.
+
+    Args:
+        cls         (type                       , required): ORM class.
+        where_shape (Tuple[Tuple[str, str], ...], required): Tuple of (column, canonical operator) pairs.
+        joins       (Tuple[str, ...]            , required): Tuple of joinable relationships.
+
+    Returns:
+        Select: Select statement template.
+    """
+
+    _stmt: Select = _apply_where_shape(
+        stmt=select(cls), cls=cls, where_shape=where_shape
+    )
+    if joins:
+        _stmt = _stmt.options(*[joinedload(getattr(cls, _join)) for _join in joins])
+
+    ## Same object as first row of `_build_select_template()` with default sorting:
+    _stmt = _stmt.order_by(desc(cls.id)).limit(1)
+    return _stmt
+
+
+@lru_cache(maxsize=256)
+def _build_count_template(
+    cls: type, where_shape: Tuple[Tuple[str, str], ...]
+) -> Select:
+    """Build and cache count statement template by `where` filter shape (see `BaseMixin._prepare_count()`).
+
+    Args:
+        cls         (type                       , required): ORM class.
+        where_shape (Tuple[Tuple[str, str], ...], required): Tuple of (column, canonical operator) pairs.
+
+    Returns:
+        Select: Count statement template.
+    """
+
+    _stmt: Select = _apply_where_shape(
+        stmt=select(func.count()).select_from(cls), cls=cls, where_shape=where_shape
+    )
+    return _stmt
+
+
+@lru_cache(maxsize=256)
+def _build_stmt_by_id_template(
+    cls: type, stmt_type: str, is_many: bool
+) -> Union[Select, Delete]:
+    """Build and cache select/delete statement by `id` or `ids` bind parameter
+    (see `BaseMixin._get_stmt_by_id()`), so each class builds them only once.
+    Single ID delete statement returns deleted `id` (`RETURNING id`), except on MySQL.
+
+    Args:
+        cls       (type, required): ORM class.
+        stmt_type (str , required): Statement type: 'select' or 'delete'.
+        is_many   (bool, required): Filter by list of IDs.
+
+    Returns:
+        Union[Select, Delete]: Select or delete statement template.
+    """
+
+    _where = cls._build_where_ids() if is_many else (cls.id == bindparam("id"))
+    if stmt_type == "delete":
+        _stmt = delete(cls).where(_where)
+        ## Check single ID delete by returned row instead of driver `rowcount`:
+        if (not is_many) and (config.db.dialect != "mysql"):
+            _stmt = _stmt.returning(cls.id)
+
+        return _stmt
+
+    return select(cls).where(_where)
+
+
 @declarative_mixin
 class IdStrMixin:
     id: Mapped[str] = mapped_column(String(64), primary_key=True, sort_order=-100)
@@ -67,6 +532,8 @@ class TimestampMixin:
         DateTime(timezone=True),
         nullable=False,
         server_default=func.CURRENT_TIMESTAMP(),
+        ## Also set by SQLAlchemy in ORM UPDATE statements if enabled:
+        onupdate=func.CURRENT_TIMESTAMP() if config.db.use_app_updated_at else None,
         sort_order=1001,
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -80,23 +547,33 @@ class TimestampMixin:
 
 @declarative_mixin
 class BaseMixin(TimestampMixin, IdStrMixin):
+    ## Unique ID prefix, set once per class (see `__init_subclass__()`):
+    _id_prefix: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._id_prefix = cls.__name__[0:3]
+
     def __init__(self, warn_mode: WarnEnum = WarnEnum.ALWAYS, **kwargs):
+        _cls = self.__class__
         if "id" not in kwargs:
-            kwargs["id"] = self.__class__.gen_unique_id()
+            kwargs["id"] = _cls.gen_unique_id()
 
+        _mapped_attrs = _get_mapped_attrs(_cls)
         for _key, _val in kwargs.items():
-            try:
-                getattr(self, _key)
+            ## Check on class, so instance attribute isn't loaded just to be replaced:
+            if (_key in _mapped_attrs) or hasattr(_cls, _key):
                 setattr(self, _key, _val)
-            except AttributeError:
-                _message = f"Not found '{_key}' attribute in `{self.__class__.__name__}` class."
-                if warn_mode == WarnEnum.ALWAYS:
-                    logger.warning(_message)
-                elif warn_mode == WarnEnum.DEBUG:
-                    logger.debug(_message)
-                elif warn_mode == WarnEnum.ERROR:
-                    logger.error(_message)
-                    raise
+                continue
+
+            _message = f"Not found '{_key}' attribute in `{_cls.__name__}` class."
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.warning(_message)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message)
+            elif warn_mode == WarnEnum.ERROR:
+                logger.error(_message)
+                raise AttributeError(_message)
 
         super().__init__()
 
@@ -108,11 +585,23 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             str: Unique ID.
         """
 
-        _prefix = cls.__name__[0:3]
-        _id = utils.gen_unique_id(prefix=_prefix)
+        _id = utils.gen_unique_id(prefix=cls._id_prefix)
         return _id
 
-    @validate_call
+    @classmethod
+    def gen_unique_ids(cls, count: int) -> List[str]:
+        """Generate list of unique IDs for ORM objects at once (e.g. for bulk insert).
+
+        Args:
+            count (int, required): Number of IDs to generate.
+
+        Returns:
+            List[str]: List of unique IDs.
+        """
+
+        _ids = utils.gen_unique_ids(count=count, prefix=cls._id_prefix)
+        return _ids
+
     def to_dict(
         self,
         excludes: Optional[List[str]] = None,
@@ -128,32 +617,46 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             Dict[str, Any]: Dictionary of ORM object.
         """
 
-        _dict = {}
-        _columns: ReadOnlyProperties = inspect(self).mapper.column_attrs
-        for _column in _columns:
-            _column_name = _column.key
-            if (not excludes) or (_column_name not in excludes):
-                _dict[_column_name] = getattr(self, _column_name)
+        _check_list_arg(name="excludes", value=excludes)
+        _check_list_arg(name="load_relations", value=load_relations)
+
+        _column_keys = _get_column_keys(self.__class__)
+        if excludes:
+            _excludes = frozenset(excludes)
+            _state_dict = self.__dict__
+            _dict = {}
+            for _column_name in _column_keys:
+                if _column_name not in _excludes:
+                    _dict[_column_name] = (
+                        _state_dict[_column_name]
+                        if _column_name in _state_dict
+                        else getattr(self, _column_name)
+                    )
+        else:
+            _dict = dict(
+                zip(_column_keys, _get_column_values_getter(self.__class__)(self))
+            )
 
         if load_relations:
             for _relation in load_relations:
                 if _relation and hasattr(self.__class__, _relation):
                     _attr = getattr(self, _relation)
-                    if (not isinstance(_attr, str)) and isinstance(_attr, Sequence):
-                        _dict[_relation] = []
-                        for _item in _attr:
-                            if isinstance(_item, DeclarativeBase):
-                                _dict[_relation].append(_item.to_dict())
-                    elif isinstance(_attr, DeclarativeBase):
+                    ## Concrete type checks, instead of slower `Sequence` ABC check:
+                    if isinstance(_attr, DeclarativeBase):
                         _dict[_relation] = _attr.to_dict()
                     elif _attr is None:
                         _dict[_relation] = None
+                    elif isinstance(_attr, (list, tuple, set)):
+                        _dict[_relation] = [
+                            _item.to_dict()
+                            for _item in _attr
+                            if isinstance(_item, DeclarativeBase)
+                        ]
                     else:
                         logger.warning(f"Can't include '{_relation}' relationship!")
 
         return _dict
 
-    @validate_call
     def to_json(
         self,
         excludes: Optional[List[str]] = None,
@@ -169,15 +672,20 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             str: JSON string of ORM object.
         """
 
-        _json = json.dumps(
-            self.to_dict(excludes=excludes, load_relations=load_relations),
-            default=str,
-            ensure_ascii=False,
-        )
+        if (not excludes) and (not load_relations):
+            ## Column values go straight to the encoder, skipping `to_dict()` checks:
+            _cls = self.__class__
+            _values = _get_column_values_getter(_cls)(self)
+            _dict = dict(zip(_get_column_keys(_cls), _values))
+        else:
+            _dict = self.to_dict(excludes=excludes, load_relations=load_relations)
+
+        _json = orjson.dumps(
+            _dict, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
         return _json
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
     def to_dict_list(
         cls,
         orm_objects: List[DeclarativeBase],
@@ -195,6 +703,29 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             List[Dict[str, Any]]: List of dictionaries from ORM objects.
         """
 
+        if not isinstance(orm_objects, (list, tuple)):
+            raise TypeError(
+                f"`orm_objects` must be a list, got `{type(orm_objects).__name__}`!"
+            )
+
+        if (not excludes) and (not load_relations):
+            ## Column keys and values getter are resolved once for the whole list:
+            _column_keys = _get_column_keys(cls)
+            _get_values = _get_column_values_getter(cls)
+            return [
+                (
+                    dict(zip(_column_keys, _get_values(_orm_object)))
+                    if _orm_object.__class__ is cls
+                    else _orm_object.to_dict()
+                )
+                for _orm_object in orm_objects
+            ]
+
+        _check_list_arg(name="load_relations", value=load_relations)
+        if excludes:
+            _check_list_arg(name="excludes", value=excludes)
+            excludes = frozenset(excludes)
+
         _dict_list = []
         for _orm_object in orm_objects:
             _dict_list.append(
@@ -204,33 +735,139 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         return _dict_list
 
     @classmethod
-    @validate_call
     def from_json(cls, json_str: str) -> DeclarativeBase:
         """Convert JSON string to ORM object.
 
         Args:
             json_str (str, required): JSON string.
 
+        Raises:
+            TypeError: If `json_str` is not a string.
+
         Returns:
             DeclarativeBase: ORM object.
         """
 
-        _dict = json.loads(json_str)
+        if not isinstance(json_str, (str, bytes)):
+            raise TypeError(
+                f"`json_str` must be a string, got `{type(json_str).__name__}`!"
+            )
+
+        _dict = orjson.loads(json_str)
         _orm_object = cls(**_dict)
         return _orm_object
 
     def __str__(self) -> str:
-        """Convert ORM object to string representation.
+        """Convert ORM object to short string representation (class name and ID),
+        without loading any attributes. Use `to_json()` for full JSON string.
 
         Returns:
             str: String representation of ORM object.
         """
 
-        _str = self.to_json()
+        _str = f"{self.__class__.__name__}(id={self.__dict__.get('id')!r})"
         return _str
 
+    def _set_attrs(self, values: Dict[str, Any]) -> None:
+        """Set attribute values of ORM object with change tracking (same as `setattr()`),
+        calling mapped attribute implementations directly instead of their descriptors.
+
+        Args:
+            values (Dict[str, Any], required): Dictionary of attribute values.
+        """
+
+        _attr_impls = _get_attr_impls(self.__class__)
+        _state = instance_state(self)
+        _state_dict = _state.dict
+        for _key, _val in values.items():
+            _attr_impl = _attr_impls.get(_key)
+            if _attr_impl is None:
+                setattr(self, _key, _val)
+            else:
+                _attr_impl.set(_state, _state_dict, _val, None)
+
+    @classmethod
+    def _raise_integrity_error(
+        cls, err: IntegrityError, pk_message: Optional[str] = None
+    ) -> None:
+        """Raise matching API exception for database integrity error, if there is one.
+        Shared by create, update and delete mixins, handler is looked up by SQLSTATE code.
+
+        Args:
+            err        (IntegrityError, required): SQLAlchemy integrity error.
+            pk_message (Optional[str] , optional): Message to log and raise `PrimaryKeyError` if ID (PK) already exists. Defaults to None.
+
+        Raises:
+            NullConstraintError : If null constraint error occurred.
+            PrimaryKeyError     : If ID (PK) already exists in database.
+            UniqueKeyError      : If unique constraint error occurred.
+            ForeignKeyError     : If foreign key constraint error occurred.
+            CheckConstraintError: If check constraint error occurred.
+        """
+
+        _handler = _SQLSTATE_HANDLERS.get(getattr(err.orig, "sqlstate", None))
+        if _handler is not None:
+            raise _handler(err.orig, pk_message)
+
+    @classmethod
+    def _build_where_ids(cls) -> ColumnElement[bool]:
+        """Build `id` filter condition for list of IDs, bound to `ids` parameter.
+        On PostgreSQL IDs are bound as a single array parameter (`id = ANY(:ids)`),
+        instead of expanding into `id IN (:id_1, :id_2, ...)` with one parameter per ID.
+
+        Returns:
+            ColumnElement[bool]: Filter condition for `where()`.
+        """
+
+        if config.db.dialect == "postgresql":
+            return cls.id == any_(bindparam("ids", type_=ARRAY(cls.id.type)))
+
+        return cls.id.in_(bindparam("ids", expanding=True))
+
+    @classmethod
+    def _split_loaded_ids(
+        cls, session: Session, ids: Sequence[Any]
+    ) -> Tuple[Dict[str, DeclarativeBase], List[Any]]:
+        """Split IDs into ORM objects already loaded in session identity map (without query),
+        and IDs which are missing or expired and need to be selected from database.
+
+        Args:
+            session (Session      , required): SQLAlchemy (sync) session to check identity map.
+            ids     (Sequence[Any], required): List of IDs.
+
+        Returns:
+            Tuple[Dict[str, DeclarativeBase], List[Any]]: Loaded ORM objects by string ID, and missing IDs.
+        """
+
+        _loaded_objects: Dict[str, DeclarativeBase] = {}
+        _missing_ids: List[Any] = []
+        for _id in ids:
+            _orm_object = session.identity_map.get(identity_key(cls, _id))
+            if (_orm_object is None) or inspect(_orm_object).expired_attributes:
+                _missing_ids.append(_id)
+            else:
+                _loaded_objects[str(_id)] = _orm_object
+
+        return _loaded_objects, _missing_ids
+
+    @classmethod
+    def _get_stmt_by_id(
+        cls, stmt_type: str = "select", is_many: bool = False
+    ) -> Union[Select, Delete]:
+        """Get cached select/delete statement filtered by `id` (`:id` parameter),
+        or by list of IDs (`:ids` parameter) if `is_many` is True.
+
+        Args:
+            stmt_type (str , optional): Statement type: 'select' or 'delete'. Defaults to 'select'.
+            is_many   (bool, optional): Filter by list of IDs. Defaults to False.
+
+        Returns:
+            Union[Select, Delete]: Select or delete statement.
+        """
+
+        return _build_stmt_by_id_template(cls, stmt_type, is_many)
+
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
     def _build_where(
         cls,
         stmt: Union[Select, Insert, Update, Delete],
@@ -244,6 +881,7 @@ class BaseMixin(TimestampMixin, IdStrMixin):
                               Dict[str, Any]]           , required): List of filter conditions
 
         Raises:
+            TypeError : If `where` is not a dictionary or list.
             ValueError: If `column` or `value` key doesn't exist in `where` filter.
 
         Returns:
@@ -253,50 +891,36 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         if isinstance(where, dict):
             where = [where]
 
+        _check_list_arg(name="where", value=where)
+
+        _columns = _get_filterable_columns(cls)
         for _where in where:
-            if "column" not in _where:
+            ## Each filter key is read only once (value can be None, so sentinel):
+            _column_name = _where.get("column", _MISSING)
+            if _column_name is _MISSING:
                 raise ValueError("Not found 'column' key in 'where'!")
 
-            if "value" not in _where:
+            _value = _where.get("value", _MISSING)
+            if _value is _MISSING:
                 raise ValueError("Not found 'value' key in 'where'!")
 
-            if (
-                ("op" not in _where)
-                or (_where["op"] == "eq")
-                or (_where["op"] == "equal")
-                or (_where["op"] == "=")
-                or (_where["op"] == "==")
-            ):
-                stmt = stmt.where(getattr(cls, _where["column"]) == _where["value"])
-            elif (
-                (_where["op"] == "ne")
-                or (_where["op"] == "not_equal")
-                or (_where["op"] == "!=")
-            ):
-                stmt = stmt.where(getattr(cls, _where["column"]) != _where["value"])
-            elif _where["op"] == "like":
-                stmt = stmt.where(
-                    getattr(cls, _where["column"]).like(f'%{_where["value"]}%')
-                )
-            elif (_where["op"] == "gt") or (_where["op"] == ">"):
-                stmt = stmt.where(getattr(cls, _where["column"]) > _where["value"])
-            elif (_where["op"] == "ge") or (_where["op"] == ">="):
-                stmt = stmt.where(getattr(cls, _where["column"]) >= _where["value"])
-            elif (_where["op"] == "lt") or (_where["op"] == "<"):
-                stmt = stmt.where(getattr(cls, _where["column"]) < _where["value"])
-            elif (_where["op"] == "le") or (_where["op"] == "<="):
-                stmt = stmt.where(getattr(cls, _where["column"]) <= _where["value"])
-            elif _where["op"] == "between":
-                stmt = stmt.where(
-                    getattr(cls, _where["column"]).between(
-                        _where["value"][0], _where["value"][1]
-                    )
+            if _column_name not in _columns:
+                raise ValueError(
+                    f"Not found '{_column_name}' column in `{cls.__name__}` to filter!"
                 )
 
+            _op = _WHERE_OPS.get(_where.get("op", "eq"))
+            if not _op:
+                continue
+
+            if _op == "like":
+                _value = f"%{_value}%"
+
+            stmt = stmt.where(_WHERE_CLAUSES[_op](getattr(cls, _column_name), _value))
+
         return stmt
 
     @classmethod
-    @validate_call
     def _build_select(
         cls,
         where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
@@ -307,7 +931,8 @@ class BaseMixin(TimestampMixin, IdStrMixin):
         joins: Optional[List[str]] = None,
         disable_limit: bool = False,
     ) -> Select:
-        """Build SQLAlchemy select statement for ORM object.
+        """Build SQLAlchemy select statement for ORM object, with its values bound.
+        Statement is built from cached template of the same shape (see `_prepare_select()`).
 
         Args:
             where          (Union[List[Dict[str, Any]],
@@ -319,54 +944,230 @@ class BaseMixin(TimestampMixin, IdStrMixin):
             joins          (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
             disable_limit  (bool                       , optional): Disable select limit. Defaults to False.
 
+        Raises:
+            TypeError : If `where`, `order_by` or `joins` argument type is invalid.
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+
         Returns:
             Select: Built SQLAlchemy select statement.
         """
 
-        _sort_direct = desc
-        if not is_desc:
-            _sort_direct = asc
+        if isinstance(where, dict):
+            where = [where]
 
-        ## Deffered join to improve performance:
-        # Subquery:
-        _sub_query: Select = select(cls.id)
-        if where:
-            _sub_query = cls._build_where(stmt=_sub_query, where=where)
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
+        _check_list_arg(name="where", value=where)
+        _check_list_arg(name="order_by", value=order_by)
+        _check_list_arg(name="joins", value=joins)
+
+        ## Cached statement template with filter, limit and offset values bound to it:
+        _stmt, _params = cls._prepare_select(
+            where=where,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            is_desc=is_desc,
+            joins=joins,
+            disable_limit=disable_limit,
+        )
+        if _params:
+            _stmt = _stmt.params(**_params)
 
-        if order_by:
-            if isinstance(order_by, str):
-                order_by = [order_by]
+        return _stmt
 
-            if isinstance(order_by, list):
-                for _order_by in order_by:
-                    if hasattr(cls, _order_by):
-                        _sub_query = _sub_query.order_by(
-                            _sort_direct(getattr(cls, _order_by))
-                        )
+    @classmethod
+    def _parse_where(
+        cls, where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None
+    ) -> Tuple[Tuple[Tuple[str, str], ...], Dict[str, Any]]:
+        """Parse `where` filter conditions into filter shape (for cached statement templates)
+        and its bind parameter values.
 
-        _sub_query: Select = _sub_query.order_by(_sort_direct(cls.id))
+        Args:
+            where (Union[List[Dict[str, Any]],
+                         Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
 
-        if not disable_limit:
-            _sub_query = _sub_query.limit(limit).offset(offset)
+        Raises:
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+            ValueError: If `column` of `where` filter isn't a column of ORM class.
 
-        # Make into subquery:
-        _sub_query: Subquery = _sub_query.subquery()
+        Returns:
+            Tuple[Tuple[Tuple[str, str], ...], Dict[str, Any]]: Filter shape and bind parameter values.
+        """
 
-        # Main query:
-        _stmt: Select = select(cls).join(_sub_query, cls.id == _sub_query.c.id)
+        if isinstance(where, dict):
+            where = [where]
 
-        if joins:
-            for _join in joins:
-                if _join and hasattr(cls, _join):
-                    _stmt = _stmt.options(joinedload(getattr(cls, _join)))
+        _columns = _get_filterable_columns(cls)
+        _where_shape = []
+        _params = {}
+        for _where in where or []:
+            ## Each filter key is read only once (value can be None, so sentinel):
+            _column_name = _where.get("column", _MISSING)
+            if _column_name is _MISSING:
+                raise ValueError("Not found 'column' key in 'where'!")
 
-        if order_by:
-            for _order_by in order_by:
-                if hasattr(cls, _order_by):
-                    _stmt = _stmt.order_by(_sort_direct(getattr(cls, _order_by)))
+            _value = _where.get("value", _MISSING)
+            if _value is _MISSING:
+                raise ValueError("Not found 'value' key in 'where'!")
 
-        _stmt = _stmt.order_by(_sort_direct(cls.id))
-        return _stmt
+            if _column_name not in _columns:
+                raise ValueError(
+                    f"Not found '{_column_name}' column in `{cls.__name__}` to filter!"
+                )
+
+            _op = _WHERE_OPS.get(_where.get("op", "eq"))
+            if not _op:
+                continue
+
+            ## Parameter index must follow the template shape, not skipped filters:
+            _i = len(_where_shape)
+            if (_op == "eq") and (_value is None):
+                _op = "is_null"
+            elif (_op == "ne") and (_value is None):
+                _op = "is_not_null"
+            elif _op == "like":
+                _params[f"p_where_{_i}"] = f"%{_value}%"
+            elif _op == "between":
+                _params[f"p_where_{_i}_0"] = _value[0]
+                _params[f"p_where_{_i}_1"] = _value[1]
+            else:
+                _params[f"p_where_{_i}"] = _value
+
+            _where_shape.append((_column_name, _op))
+
+        return tuple(_where_shape), _params
+
+    @classmethod
+    def _prepare_delete(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        returning_ids: bool = False,
+    ) -> Tuple[Delete, Dict[str, Any]]:
+        """Get cached delete statement for the shape of `where` filter conditions and its bind parameter values.
+
+        Args:
+            where         (Union[List[Dict[str, Any]],
+                                 Dict[str, Any]]      , required): List of filter conditions.
+            returning_ids (bool                       , optional): Return deleted IDs (`RETURNING id`). Defaults to False.
+
+        Raises:
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+
+        Returns:
+            Tuple[Delete, Dict[str, Any]]: Delete statement and its parameters for execution.
+        """
+
+        _where_shape, _params = cls._parse_where(where=where)
+        _stmt: Delete = _build_delete_template(cls, _where_shape, returning_ids)
+        return _stmt, _params
+
+    @classmethod
+    def _prepare_count(
+        cls, where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get cached count statement for the shape of `where` filter conditions and its bind parameter values.
+
+        Args:
+            where (Union[List[Dict[str, Any]],
+                         Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+
+        Raises:
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Count statement and its parameters for execution.
+        """
+
+        _where_shape, _params = cls._parse_where(where=where)
+        _stmt: Select = _build_count_template(cls, _where_shape)
+        return _stmt, _params
+
+    @classmethod
+    def _prepare_select_one(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        joins: Optional[List[str]] = None,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get cached single object (`LIMIT 1`) select statement for the shape
+        of `where` filter conditions and its bind parameter values.
+
+        Args:
+            where (Union[List[Dict[str, Any]],
+                         Dict[str, Any]]      , required): List of filter conditions.
+            joins (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
+
+        Raises:
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Select statement and its parameters for execution.
+        """
+
+        _where_shape, _params = cls._parse_where(where=where)
+        _relations = _get_joinable_relations(cls)
+        _joins = tuple(_join for _join in (joins or []) if _join in _relations)
+        _stmt: Select = _build_select_one_template(cls, _where_shape, _joins)
+        return _stmt, _params
+
+    @classmethod
+    def _prepare_select(
+        cls,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        offset: int = 0,
+        limit: int = config.db.select_limit,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        joins: Optional[List[str]] = None,
+        disable_limit: bool = False,
+        with_total: bool = False,
+    ) -> Tuple[Select, Dict[str, Any]]:
+        """Get cached select statement for the shape of arguments and its bind parameter values.
+        Statement is built only once per shape, values are returned separately for execution.
+
+        Args:
+            where          (Union[List[Dict[str, Any]],
+                                  Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+            offset         (int                        , optional): Offset number. Defaults to 0.
+            limit          (int                        , optional): Limit number. Defaults to `config.db.select_limit`.
+            order_by       (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc        (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            joins          (Optional[List[str]]        , optional): List of joinable relationships. Defaults to None.
+            disable_limit  (bool                       , optional): Disable select limit. Defaults to False.
+            with_total     (bool                       , optional): Select (ORM object, total count) rows. Defaults to False.
+
+        Raises:
+            ValueError: If `column` or `value` key doesn't exist in `where` filter.
+
+        Returns:
+            Tuple[Select, Dict[str, Any]]: Select statement and its parameters for execution.
+        """
+
+        _where_shape, _params = cls._parse_where(where=where)
+
+        if isinstance(order_by, str):
+            order_by = [order_by]
+
+        _columns = _get_filterable_columns(cls)
+        _order_by = tuple(_col for _col in (order_by or []) if _col in _columns)
+        _relations = _get_joinable_relations(cls)
+        _joins = tuple(_join for _join in (joins or []) if _join in _relations)
+
+        if not disable_limit:
+            _params["p_limit"] = limit
+            _params["p_offset"] = offset
+
+        _stmt: Select = _build_select_template(
+            cls,
+            _where_shape,
+            _order_by,
+            is_desc,
+            _joins,
+            disable_limit,
+            with_total,
+        )
+        return _stmt, _params
 
 
 __all__ = [
@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, Union, List
+from functools import lru_cache
+from operator import itemgetter
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+    Union,
+    List,
+    Literal,
+    Iterator,
+    Optional,
+    AsyncIterator,
+)
 
-from pydantic import validate_call
-from sqlalchemy import Result
+from sqlalchemy import Result, Dialect
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,56 +23,129 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from api.core.constants import WarnEnum
 from api.config import config
 
-if config.db.dialect == "postgresql":
+## Database dialect is fixed for process lifetime, bound once for method branches:
+_DIALECT = config.db.dialect
+
+if _DIALECT == "postgresql":
     from sqlalchemy.dialects.postgresql import Insert, insert
-    from psycopg.errors import (
-        NotNullViolation,
-        UniqueViolation,
-        ForeignKeyViolation,
-        CheckViolation,
-    )
-elif (config.db.dialect == "mysql") or (config.db.dialect == "mariadb"):
+    from psycopg import sql as pg_sql, Pipeline as PgPipeline
+    from psycopg.errors import IntegrityError as PgIntegrityError
+elif (_DIALECT == "mysql") or (_DIALECT == "mariadb"):
     from sqlalchemy.dialects.mysql import Insert, insert
 else:
     from sqlalchemy import Insert, insert
-from api.core.exceptions import (
-    EmptyValueError,
-    PrimaryKeyError,
-    UniqueKeyError,
-    NullConstraintError,
-    ForeignKeyError,
-    CheckConstraintError,
-)
+from api.core.exceptions import EmptyValueError
 from api.logger import logger
 
 from ._update import AsyncUpdateMixin
 
 
+## PostgreSQL column type OIDs by table name for binary `COPY`, fetched once per table:
+_COPY_TYPE_OIDS: Dict[str, Dict[str, int]] = {}
+## OIDs below it are built-in types (`FirstNormalObjectId`):
+_PG_FIRST_NORMAL_OID = 16384
+## Session info key marking the session's connection is in psycopg pipeline mode:
+_PIPELINE_INFO_KEY = "pg_pipeline"
+
+
+def _check_pipeline_returning(
+    async_session: AsyncSession, returning: Union[bool, Literal["pk"]]
+) -> None:
+    """Check `returning` isn't used inside `async_pipeline()`, results of pipelined statements
+    arrive only at the next pipeline sync, but SQLAlchemy reads them right after execute.
+
+    Args:
+        async_session (AsyncSession    , required): SQLAlchemy async_session for database connection.
+        returning     (Union[bool, str], required): Return inserted/upserted ORM objects or their IDs.
+
+    Raises:
+        ValueError: If `returning` is used inside `async_pipeline()`.
+    """
+
+    if returning and async_session.info.get(_PIPELINE_INFO_KEY, False):
+        raise ValueError(
+            "Can't use `returning` or `orm_way` inside `async_pipeline()`, results are only received at pipeline sync!"
+        )
+
+    return
+
+
+@lru_cache(maxsize=256)
+def _is_copy_compatible(cls: type, keys: Tuple[str, ...], dialect: Dialect) -> bool:
+    """Check rows with given keys are stored the same with `COPY` as with `INSERT`.
+    `COPY` skips SQLAlchemy type bind processors and Python side column defaults of missing columns.
+
+    Args:
+        cls     (type           , required): ORM class.
+        keys    (Tuple[str, ...], required): Column (attribute) keys of rows.
+        dialect (Dialect        , required): Database dialect for type bind processors.
+
+    Returns:
+        bool: True if `COPY` can be used for the rows.
+    """
+
+    for _key, _column in cls.__mapper__.columns.items():
+        if _key in keys:
+            if _column.type.bind_processor(dialect) is not None:
+                return False
+        elif _column.default is not None:
+            return False
+
+    return True
+
+
+@lru_cache(maxsize=256)
+def _build_insert_template(cls: type, returning: Union[bool, str]) -> Insert:
+    """Build and cache dialect insert statement per ORM class and `returning` mode,
+    so it isn't constructed on every insert call. Bulk (executemany) inserts are sent
+    in batches of `config.db.bulk_batch_size` rows per statement.
+
+    Args:
+        cls       (type            , required): ORM class.
+        returning (Union[bool, str], required): Return inserted ORM object, only its ID if 'pk'.
+
+    Returns:
+        Insert: Insert statement template.
+    """
+
+    _stmt: Insert = insert(cls).execution_options(
+        insertmanyvalues_page_size=config.db.bulk_batch_size
+    )
+    if returning == "pk":
+        _stmt = _stmt.returning(cls.id)
+    elif returning:
+        _stmt = _stmt.returning(cls)
+
+    return _stmt
+
+
 @declarative_mixin
 class AsyncCreateMixin(AsyncUpdateMixin):
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
     async def async_insert(
         cls,
         async_session: AsyncSession,
         orm_way: bool = False,
-        returning: bool = True,
+        returning: Union[bool, Literal["pk"]] = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
+        data: Optional[Dict[str, Any]] = None,
         **kwargs,
-    ) -> DeclarativeBase:
+    ) -> Union[DeclarativeBase, str, None]:
         """Insert new data/ORM object into database.
 
         Args:
-            async_session (AsyncSession  , required): SQLAlchemy async_session for database connection.
-            orm_way       (bool          , optional): Use ORM way to insert object into database. Defaults to False.
-            returning     (bool          , optional): Return inserted ORM object from database. Defaults to True.
-            auto_commit   (bool          , optional): Auto commit. Defaults to False.
-            warn_mode     (WarnEnum      , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
-            **kwargs      (Dict[str, Any], required): Dictionary of object data.
+            async_session (AsyncSession            , required): SQLAlchemy async_session for database connection.
+            orm_way       (bool                    , optional): Use ORM way to insert object into database. Defaults to False.
+            returning     (Union[bool, str]        , optional): Return inserted ORM object from database, only its ID if 'pk'. Defaults to False.
+            auto_commit   (bool                    , optional): Auto commit. Defaults to False.
+            warn_mode     (WarnEnum                , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            data          (Optional[Dict[str, Any]], optional): Dictionary of object data, used as is without copying (`id` is added if missing). Defaults to None.
+            **kwargs      (Dict[str, Any]          , optional): Dictionary of object data.
 
         Raises:
             EmptyValueError     : If no data provided to insert.
+            ValueError          : If `returning` or `orm_way` is used inside `async_pipeline()`.
             NullConstraintError : If null constraint error occurred.
             PrimaryKeyError     : If ID (PK) already exists in database.
             UniqueKeyError      : If unique constraint error occurred.
@@ -69,28 +154,35 @@ class AsyncCreateMixin(AsyncUpdateMixin):
             Exception           : If failed to save object into database.
 
         Returns:
-            DeclarativeBase: New ORM object.
+            Union[DeclarativeBase, str, None]: New ORM object, its ID or None (`returning`).
         """
 
-        if not kwargs:
+        if data is None:
+            data = kwargs
+        elif kwargs:
+            data = {**data, **kwargs}
+
+        if not data:
             raise EmptyValueError("No data provided to insert!")
 
-        if "id" not in kwargs:
-            kwargs["id"] = cls.gen_unique_id()
+        _check_pipeline_returning(async_session, returning or orm_way)
+
+        if "id" not in data:
+            data["id"] = cls.gen_unique_id()
 
         _orm_object: Union[DeclarativeBase, None] = None
         try:
             if orm_way:
-                _orm_object = cls(**kwargs)
+                _orm_object = cls(**data)
                 async_session.add(_orm_object)
 
                 if auto_commit:
                     await async_session.commit()
 
             else:
-                _stmt: Insert = insert(cls).values(**kwargs)
-                if returning:
-                    _stmt = _stmt.returning(cls)
+                _stmt: Insert = _build_insert_template(
+                    cls, returning if returning == "pk" else bool(returning)
+                ).values(data)
 
                 _result: Result = await async_session.execute(_stmt)
                 if returning:
@@ -104,31 +196,12 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                 await async_session.rollback()
 
             if isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    if "(id)=" in _detail:
-                        logger.error(
-                            f"`{cls.__name__}` '{kwargs['id']}' ID already exists in database!"
-                        )
-                        raise PrimaryKeyError(_detail)
-
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                cls._raise_integrity_error(
+                    err,
+                    pk_message=f"`{cls.__name__}` '{data['id']}' ID already exists in database!",
+                )
 
-            _message = f"Failed to insert `{cls.__name__}` object '{kwargs['id']}' ID into database!"
+            _message = f"Failed to insert `{cls.__name__}` object '{data['id']}' ID into database!"
             if warn_mode == WarnEnum.ALWAYS:
                 logger.error(_message)
             if warn_mode == WarnEnum.DEBUG:
@@ -138,21 +211,22 @@ class AsyncCreateMixin(AsyncUpdateMixin):
 
         return _orm_object
 
-    @validate_call(config={"arbitrary_types_allowed": True})
     async def async_save(
         self,
         async_session: AsyncSession,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
+        data: Optional[Dict[str, Any]] = None,
         **kwargs,
     ) -> DeclarativeBase:
         """Save ORM object into database.
 
         Args:
-            async_session (AsyncSession  , required): SQLAlchemy async_session for database connection.
-            auto_commit   (bool          , optional): Auto commit. Defaults to False.
-            warn_mode     (WarnEnum      , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
-            **kwargs      (Dict[str, Any], optional): Dictionary of ORM object data.
+            async_session (AsyncSession            , required): SQLAlchemy async_session for database connection.
+            auto_commit   (bool                    , optional): Auto commit. Defaults to False.
+            warn_mode     (WarnEnum                , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            data          (Optional[Dict[str, Any]], optional): Dictionary of ORM object data, used instead of building `**kwargs`. Defaults to None.
+            **kwargs      (Dict[str, Any]          , optional): Dictionary of ORM object data.
 
         Raises:
             NullConstraintError : If null constraint error occurred.
@@ -166,18 +240,18 @@ class AsyncCreateMixin(AsyncUpdateMixin):
             DeclarativeBase: Created or updated ORM object.
         """
 
+        if data is None:
+            data = kwargs
+        elif kwargs:
+            data = {**data, **kwargs}
+
         try:
-            for _key, _val in kwargs.items():
-                setattr(self, _key, _val)
-
-            _orm_object: Union[DeclarativeBase, None] = await self.__class__.async_get(
-                async_session=async_session,
-                id=self.id,
-                allow_no_result=True,
-                warn_mode=WarnEnum.IGNORE,
-            )
+            if data:
+                self._set_attrs(data)
 
-            if not _orm_object:
+            ## Add object which isn't in session yet (new or detached) without selecting
+            ## it first, new object with already existing ID fails on flush (INSERT):
+            if self not in async_session:
                 async_session.add(self)
 
             if auto_commit:
@@ -188,29 +262,10 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                 await async_session.rollback()
 
             if isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    if "(id)=" in _detail:
-                        logger.error(
-                            f"`{self.__class__.__name__}` '{self.id}' ID already exists in database!"
-                        )
-                        raise PrimaryKeyError(_detail)
-
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                self._raise_integrity_error(
+                    err,
+                    pk_message=f"`{self.__class__.__name__}` '{self.id}' ID already exists in database!",
+                )
 
             _message = f"Failed to save `{self.__class__.__name__}` object (self) '{self.id}' ID into database!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -223,28 +278,28 @@ class AsyncCreateMixin(AsyncUpdateMixin):
         return self
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
     async def async_upsert(
         cls,
         async_session: AsyncSession,
         orm_way: bool = False,
-        returning: bool = True,
+        returning: Union[bool, Literal["pk"]] = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
         **kwargs,
-    ) -> Union[DeclarativeBase, None]:
+    ) -> Union[DeclarativeBase, str, None]:
         """Upsert data into database.
 
         Args:
-            async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
-            orm_way       (bool        , optional): Check if object exists in database. Defaults to False.
-            returning     (bool        , optional): Return upserted ORM object from database. Defaults to True.
-            auto_commit   (bool        , optional): Auto commit. Defaults to False.
-            warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
-            **kwargs      (Dict        , required): Dictionary of object data.
+            async_session (AsyncSession    , required): SQLAlchemy async_session for database connection.
+            orm_way       (bool            , optional): Return upserted ORM object, selects it and updates or inserts on dialects other than PostgreSQL. Defaults to False.
+            returning     (Union[bool, str], optional): Return upserted ORM object from database, only its ID if 'pk'. Defaults to False.
+            auto_commit   (bool            , optional): Auto commit. Defaults to False.
+            warn_mode     (WarnEnum        , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            **kwargs      (Dict            , required): Dictionary of object data.
 
         Raises:
             EmptyValueError     : If no data provided to upsert.
+            ValueError          : If `returning` or `orm_way` is used inside `async_pipeline()`.
             NullConstraintError : If null constraint error occurred.
             UniqueKeyError      : If unique constraint error occurred.
             ForeignKeyError     : If foreign key constraint error occurred.
@@ -252,14 +307,17 @@ class AsyncCreateMixin(AsyncUpdateMixin):
             Exception           : If failed to upsert object into database.
 
         Returns:
-            Union[DeclarativeBase, None]: Upserted ORM object.
+            Union[DeclarativeBase, str, None]: Upserted ORM object, its ID or None (`returning`).
         """
 
         if not kwargs:
             raise EmptyValueError("No data provided to upsert!")
 
+        _check_pipeline_returning(async_session, returning or orm_way)
+
         _orm_object: Union[cls, None] = None
-        if orm_way:
+        ## PostgreSQL upserts in a single `INSERT ... ON CONFLICT ... RETURNING` statement:
+        if orm_way and (_DIALECT != "postgresql"):
             if "id" in kwargs:
                 _orm_object: Union[cls, None] = await cls.async_get(
                     async_session=async_session,
@@ -284,6 +342,9 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                     **kwargs,
                 )
         else:
+            if orm_way:
+                returning = True
+
             try:
                 if "id" not in kwargs:
                     kwargs["id"] = cls.gen_unique_id()
@@ -292,18 +353,21 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                     key: value for key, value in kwargs.items() if key != "id"
                 }
 
-                _stmt: Insert = insert(cls).values(**kwargs)
+                _stmt: Insert = _build_insert_template(
+                    cls, returning if returning == "pk" else bool(returning)
+                ).values(**kwargs)
                 # Only for PostgreSQL
-                if config.db.dialect == "postgresql":
+                if _DIALECT == "postgresql":
                     _stmt = _stmt.on_conflict_do_update(
                         index_elements=["id"], set_=_update_set
                     )
                 # Only for MySQL and MariaDB
-                elif (config.db.dialect == "mysql") or (config.db.dialect == "mariadb"):
+                elif (_DIALECT == "mysql") or (_DIALECT == "mariadb"):
                     _stmt = _stmt.on_duplicate_key_update(**_update_set)
 
-                if returning:
-                    _stmt = _stmt.returning(cls)
+                if orm_way:
+                    ## Refresh already loaded object in session with upserted row:
+                    _stmt = _stmt.execution_options(populate_existing=True)
 
                 _result: Result = await async_session.execute(_stmt)
                 if returning:
@@ -317,23 +381,7 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                     await async_session.rollback()
 
                 if isinstance(err, IntegrityError):
-                    if isinstance(err.orig, NotNullViolation):
-                        raise NullConstraintError(
-                            f"`{err.orig.diag.column_name}` cannot be NULL."
-                        )
-                    elif isinstance(err.orig, UniqueViolation):
-                        _detail = err.orig.diag.message_detail.replace("Key ", "")
-                        raise UniqueKeyError(_detail)
-                    elif isinstance(err.orig, ForeignKeyViolation):
-                        _detail = (
-                            err.orig.diag.message_detail.replace("Key ", "")
-                            .replace('"', "'")
-                            .replace(f"table '{config.db.prefix}", "'")
-                        )
-                        raise ForeignKeyError(_detail)
-                    elif isinstance(err.orig, CheckViolation):
-                        _detail = err.orig.diag.message_detail.replace("Key ", "")
-                        raise CheckConstraintError(_detail)
+                    cls._raise_integrity_error(err)
 
                 _message = f"Failed to upsert `{cls.__name__}` object '{kwargs['id']}' ID into database!"
                 if warn_mode == WarnEnum.ALWAYS:
@@ -346,26 +394,35 @@ class AsyncCreateMixin(AsyncUpdateMixin):
         return _orm_object
 
     @classmethod
-    @validate_call(config={"arbitrary_types_allowed": True})
     async def async_bulk_insert(
         cls,
         async_session: AsyncSession,
         raw_data: List[Dict[str, Any]],
-        returning: bool = True,
+        returning: Union[bool, Literal["pk"]] = False,
         auto_commit: bool = False,
+        stream: bool = False,
+        partition_size: int = 1000,
+        use_copy: Optional[bool] = None,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
-    ) -> List[DeclarativeBase]:
+    ) -> Union[
+        List[Union[DeclarativeBase, str]], Iterator[List[Union[DeclarativeBase, str]]]
+    ]:
         """Bulk insert data into database.
 
         Args:
-            async_session (AsyncSession        , required): SQLAlchemy async_session for database connection.
-            raw_data      (List[Dict[str, Any]], required): List of dictionary object data.
-            returning     (bool                , optional): Return inserted ORM objects from database. Defaults to True.
-            auto_commit   (bool                , optional): Auto commit. Defaults to False.
-            warn_mode     (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            async_session  (AsyncSession        , required): SQLAlchemy async_session for database connection.
+            raw_data       (List[Dict[str, Any]], required): List of dictionary object data.
+            returning      (Union[bool, str]    , optional): Return inserted ORM objects from database, only their IDs if 'pk'. Defaults to False.
+            auto_commit    (bool                , optional): Auto commit. Defaults to False.
+            stream         (bool                , optional): Yield returned rows in partitions instead of a single list. Defaults to False.
+            partition_size (int                 , optional): Number of rows per partition when `stream` is True. Defaults to 1000.
+            use_copy       (Optional[bool]      , optional): Insert with PostgreSQL `COPY` (only without `returning` and if rows are stored the same as with `INSERT`), auto if None and rows >= `config.db.copy_threshold`. Defaults to None.
+            warn_mode      (WarnEnum            , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
+            TypeError           : If `raw_data` is not a list.
             EmptyValueError     : If no data provided to bulk insert.
+            ValueError          : If `returning` is used inside `async_pipeline()`.
             NullConstraintError : If null constraint error occurred.
             PrimaryKeyError     : If ID (PK) already exists in database.
             UniqueKeyError      : If unique constraint error occurred.
@@ -374,25 +431,70 @@ class AsyncCreateMixin(AsyncUpdateMixin):
             Exception           : If failed to bulk insert objects into database.
 
         Returns:
-            List[DeclarativeBase]: List of inserted ORM objects.
+            Union[List, Iterator[List]]: List of inserted ORM objects or their IDs (`returning`), or iterator of their partitions (`stream`).
         """
 
+        if not isinstance(raw_data, list):
+            raise TypeError(
+                f"`raw_data` must be a list, got `{type(raw_data).__name__}`!"
+            )
+
         if not raw_data:
             raise EmptyValueError("No data provided to bulk insert!")
 
-        for _data in raw_data:
-            if "id" not in _data:
-                _data["id"] = cls.gen_unique_id()
+        _check_pipeline_returning(async_session, returning)
+
+        _no_id_data = [_data for _data in raw_data if "id" not in _data]
+        if _no_id_data:
+            for _data, _id in zip(
+                _no_id_data, cls.gen_unique_ids(count=len(_no_id_data))
+            ):
+                _data["id"] = _id
+
+        ## `COPY` isn't supported in pipeline mode:
+        if (
+            (not returning)
+            and (_DIALECT == "postgresql")
+            and (not async_session.info.get(_PIPELINE_INFO_KEY, False))
+        ):
+            if use_copy is None:
+                use_copy = (config.db.copy_threshold is not None) and (
+                    config.db.copy_threshold <= len(raw_data)
+                )
+
+            if use_copy:
+                ## Missing columns would be NULL instead of default in `COPY`:
+                _keys = raw_data[0].keys()
+                use_copy = all(_data.keys() == _keys for _data in raw_data)
+
+            if use_copy:
+                ## `COPY` skips type bind processors and Python side defaults:
+                use_copy = _is_copy_compatible(
+                    cls, tuple(_keys), async_session.get_bind().dialect
+                )
+        else:
+            use_copy = False
 
         _orm_objects: List[cls] = []
         try:
-            _stmt: Insert = insert(cls)
-            if returning:
-                _stmt = _stmt.returning(cls)
+            if use_copy:
+                await cls._copy_rows(async_session=async_session, raw_data=raw_data)
+                if auto_commit:
+                    await async_session.commit()
+
+                return _orm_objects
+
+            _stmt: Insert = _build_insert_template(
+                cls, returning if returning == "pk" else bool(returning)
+            )
 
             _result: Result = await async_session.execute(_stmt, raw_data)
             if returning:
-                _orm_objects: List[cls] = _result.scalars().all()
+                if stream:
+                    ## Hydrate ORM objects per partition instead of all at once:
+                    _orm_objects = _result.scalars().partitions(partition_size)
+                else:
+                    _orm_objects: List[cls] = _result.scalars().all()
 
             if auto_commit:
                 await async_session.commit()
@@ -402,29 +504,10 @@ class AsyncCreateMixin(AsyncUpdateMixin):
                 await async_session.rollback()
 
             if isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    if "(id)=" in _detail:
-                        logger.error(
-                            f"`{cls.__name__}` IDs already exists in database!"
-                        )
-                        raise PrimaryKeyError(_detail)
-
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                cls._raise_integrity_error(
+                    err,
+                    pk_message=f"`{cls.__name__}` IDs already exists in database!",
+                )
 
             _message = f"Failed to bulk insert `{cls.__name__}` objects into database!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -436,5 +519,101 @@ class AsyncCreateMixin(AsyncUpdateMixin):
 
         return _orm_objects
 
+    @classmethod
+    @asynccontextmanager
+    async def async_pipeline(cls, async_session: AsyncSession) -> AsyncIterator[None]:
+        """Context manager to run statements of the session's connection in psycopg pipeline mode,
+        so multiple statements (e.g. many `async_insert()` calls) are sent without
+        waiting for each result. Does nothing if pipeline mode isn't supported (non PostgreSQL or libpq < 14).
+        Results are only received at pipeline sync, so `returning` and `orm_way` (ORM flush reads
+        returned rows) can't be used inside it and bulk insert doesn't use `COPY`.
+
+        Args:
+            async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
+
+        Yields:
+            None: Inside pipeline mode.
+        """
+
+        if (_DIALECT != "postgresql") or (not PgPipeline.is_supported()):
+            yield
+            return
+
+        _connection = await async_session.connection()
+        _raw_connection = await _connection.get_raw_connection()
+        async with _raw_connection.driver_connection.pipeline():
+            async_session.info[_PIPELINE_INFO_KEY] = True
+            try:
+                yield
+            finally:
+                async_session.info.pop(_PIPELINE_INFO_KEY, None)
+
+    @classmethod
+    async def _copy_rows(
+        cls, async_session: AsyncSession, raw_data: List[Dict[str, Any]]
+    ) -> None:
+        """Insert rows with PostgreSQL binary `COPY ... FROM STDIN` through the session's connection
+        (same transaction), without per-row statement binding and `RETURNING`.
+        Values are sent in binary format by table column types (built-in types only),
+        without text encoding/parsing on both sides.
+
+        Args:
+            async_session (AsyncSession        , required): SQLAlchemy async_session for database connection.
+            raw_data      (List[Dict[str, Any]], required): List of dictionary object data with the same keys.
+
+        Raises:
+            IntegrityError: If any constraint is violated while copying rows.
+        """
+
+        _columns = list(raw_data[0].keys())
+        _mapper_columns = cls.__mapper__.columns
+        _table = cls.__table__
+        _column_names = [_mapper_columns[_column].name for _column in _columns]
+        _table_identifier = pg_sql.Identifier(
+            *filter(None, (_table.schema, _table.name))
+        )
+        ## Row values tuple getter, single column getter returns only the value:
+        _get_row = (
+            itemgetter(*_columns)
+            if len(_columns) > 1
+            else (lambda _data: (_data[_columns[0]],))
+        )
+
+        _connection = await async_session.connection()
+        _raw_connection = await _connection.get_raw_connection()
+        _driver_connection = _raw_connection.driver_connection
+        try:
+            async with _driver_connection.cursor() as _cursor:
+                _type_oids = _COPY_TYPE_OIDS.get(_table.fullname)
+                if _type_oids is None:
+                    await _cursor.execute(
+                        "SELECT attname, atttypid::int FROM pg_attribute WHERE"
+                        " attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+                        (_table_identifier.as_string(_driver_connection),),
+                    )
+                    _type_oids = dict(await _cursor.fetchall())
+                    _COPY_TYPE_OIDS[_table.fullname] = _type_oids
+
+                _oids = [_type_oids[_name] for _name in _column_names]
+                ## User-defined types (e.g. enums) may lack binary dumper, copy as text:
+                _is_binary = all(_oid < _PG_FIRST_NORMAL_OID for _oid in _oids)
+                _copy_sql = pg_sql.SQL(
+                    "COPY {} ({}) FROM STDIN (FORMAT BINARY)"
+                    if _is_binary
+                    else "COPY {} ({}) FROM STDIN"
+                ).format(
+                    _table_identifier,
+                    pg_sql.SQL(", ").join(map(pg_sql.Identifier, _column_names)),
+                )
+                async with _cursor.copy(_copy_sql) as _copy:
+                    if _is_binary:
+                        _copy.set_types(_oids)
+
+                    for _row in map(_get_row, raw_data):
+                        await _copy.write_row(_row)
+        except PgIntegrityError as err:
+            ## Same exception type as `insert()` path, to be handled the same way:
+            raise IntegrityError(f"COPY {_table.name}", None, err) from err
+
 
 __all__ = ["AsyncCreateMixin"]
@@ -3,19 +3,14 @@
 from typing import List, Dict, Union, Any
 
 from pydantic import validate_call
-from sqlalchemy import Delete, delete, Result
+from sqlalchemy import Delete, delete, Result, text
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.exc import NoResultFound, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.constants import WarnEnum
 from api.config import config
-
-if config.db.dialect == "postgresql":
-    from psycopg.errors import ForeignKeyViolation
-# else:
-#     from sqlalchemy.exc import IntegrityError as ForeignKeyViolation
-from api.core.exceptions import EmptyValueError, ForeignKeyError
+from api.core.exceptions import EmptyValueError
 from api.logger import logger
 
 from ._read import AsyncReadMixin
@@ -27,13 +22,17 @@ class AsyncDeleteMixin(AsyncReadMixin):
     async def async_delete(
         self,
         async_session: AsyncSession,
+        orm_way: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
         """Delete ORM object from database.
+        By default object is deleted by its ID with delete statement (without session
+        unit-of-work flush), then expunged from session.
 
         Args:
             async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
+            orm_way       (bool        , optional): Use ORM way to delete object (keeps ORM cascades and events). Defaults to False.
             auto_commit   (bool        , optional): Auto commit. Defaults to False.
             warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -42,6 +41,18 @@ class AsyncDeleteMixin(AsyncReadMixin):
             Exception    : If failed to delete ORM object from database.
         """
 
+        if not orm_way:
+            await self.__class__.async_delete_by_id(
+                async_session=async_session,
+                id=self.id,
+                auto_commit=auto_commit,
+                warn_mode=warn_mode,
+            )
+            if self in async_session:
+                async_session.expunge(self)
+
+            return
+
         try:
             await async_session.delete(self)
 
@@ -54,19 +65,14 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
             if isinstance(err, NoResultFound):
                 raise
-            elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            elif isinstance(err, IntegrityError):
+                self._raise_integrity_error(err)
 
-            _message = f"Failed to delete `{self.__class__.__name__}` object (self) '{self.id}' ID from database!"
+            _message = "Failed to delete `{}` object (self) '{}' ID from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, self.__class__.__name__, self.id)
             elif warn_mode == WarnEnum.ONCE:
-                logger.warning(_message)
+                logger.warning(_message, self.__class__.__name__, self.id)
 
             raise
 
@@ -101,22 +107,29 @@ class AsyncDeleteMixin(AsyncReadMixin):
             )
             await _orm_object.async_delete(
                 async_session=async_session,
+                orm_way=True,
                 auto_commit=auto_commit,
                 warn_mode=warn_mode,
             )
         else:
             try:
-                _stmt: Delete = delete(cls).where(cls.id == id)
-                _result: Result = await async_session.execute(_stmt)
+                _stmt: Delete = cls._get_stmt_by_id(stmt_type="delete")
+                _result: Result = await async_session.execute(_stmt, {"id": id})
+                if _result.returns_rows:
+                    _is_deleted = _result.scalar_one_or_none() is not None
+                else:
+                    _is_deleted = 0 < _result.rowcount
 
                 if auto_commit:
                     await async_session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row from `{}` ORM table.",
+                    int(_is_deleted),
+                    cls.__name__,
                 )
 
-                if _result.rowcount == 0:
+                if not _is_deleted:
                     raise NoResultFound(
                         f"Not found any `{cls.__name__}` object with '{id}' ID from database!"
                     )
@@ -127,21 +140,14 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
                 if isinstance(err, NoResultFound):
                     raise
-                elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
+                elif isinstance(err, IntegrityError):
+                    cls._raise_integrity_error(err)
 
-                _message = (
-                    f"Failed to delete `{cls.__name__}` object '{id}' ID from database!"
-                )
+                _message = "Failed to delete `{}` object '{}' ID from database!"
                 if warn_mode == WarnEnum.ALWAYS:
-                    logger.error(_message)
+                    logger.error(_message, cls.__name__, id)
                 elif warn_mode == WarnEnum.DEBUG:
-                    logger.debug(_message)
+                    logger.debug(_message, cls.__name__, id)
 
                 raise
 
@@ -153,16 +159,20 @@ class AsyncDeleteMixin(AsyncReadMixin):
         cls,
         async_session: AsyncSession,
         ids: List[str],
+        batch_size: int = config.db.delete_batch_size,
+        skip_failed_batch: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
-        """Delete rows/ORM objects from database by ID list.
+        """Delete rows/ORM objects from database by ID list, in batches of `batch_size` IDs per statement.
 
         Args:
-            async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
-            ids           (List[str]   , required): List of IDs.
-            auto_commit   (bool        , optional): Auto commit. Defaults to False.
-            warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            async_session     (AsyncSession, required): SQLAlchemy async_session for database connection.
+            ids               (List[str]   , required): List of IDs.
+            batch_size        (int         , optional): Max IDs per delete statement. Defaults to `config.db.delete_batch_size`.
+            skip_failed_batch (bool        , optional): Run each batch in SAVEPOINT, log and skip failed batches. Defaults to False.
+            auto_commit       (bool        , optional): Auto commit. Defaults to False.
+            warn_mode         (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             EmptyValueError: If no IDs provided to delete.
@@ -173,18 +183,41 @@ class AsyncDeleteMixin(AsyncReadMixin):
         if not ids:
             raise EmptyValueError("No IDs provided to delete!")
 
+        ## Remove duplicate IDs and keep order:
+        ids = list(dict.fromkeys(ids))
+
         try:
-            _stmt: Delete = delete(cls).where(cls.id.in_(ids))
-            _result: Result = await async_session.execute(_stmt)
+            _rowcount = 0
+            _stmt: Delete = cls._get_stmt_by_id(stmt_type="delete", is_many=True)
+            for _i in range(0, len(ids), batch_size):
+                _params = {"ids": ids[_i : (_i + batch_size)]}
+                if skip_failed_batch:
+                    ## Run each batch in SAVEPOINT, so failed batch doesn't abort others:
+                    try:
+                        async with async_session.begin_nested():
+                            _result: Result = await async_session.execute(
+                                _stmt, _params
+                            )
+                    except Exception:
+                        logger.warning(
+                            "Failed to delete `{}` objects batch with '{}' IDs, skipped!",
+                            cls.__name__,
+                            _params["ids"],
+                        )
+                        continue
+                else:
+                    _result: Result = await async_session.execute(_stmt, _params)
+
+                _rowcount += _result.rowcount
 
-            if auto_commit:
-                await async_session.commit()
+                if auto_commit:
+                    await async_session.commit()
 
             logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                "Deleted '{}' row(s) from `{}` ORM table.", _rowcount, cls.__name__
             )
 
-            if _result.rowcount == 0:
+            if _rowcount == 0:
                 raise NoResultFound(
                     f"Not found any `{cls.__name__}` objects with '{ids}' IDs from database!"
                 )
@@ -195,19 +228,14 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
             if isinstance(err, NoResultFound):
                 raise
-            elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            elif isinstance(err, IntegrityError):
+                cls._raise_integrity_error(err)
 
-            _message = f"Failed to delete `{cls.__name__}` objects by '{ids}' IDs from database!"
+            _message = "Failed to delete `{}` objects by '{}' IDs from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, ids)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, ids)
 
             raise
 
@@ -219,14 +247,18 @@ class AsyncDeleteMixin(AsyncReadMixin):
         cls,
         async_session: AsyncSession,
         orm_objects: List[DeclarativeBase],
+        orm_way: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
         """Delete ORM objects from database.
+        By default all objects are deleted by their IDs with bulk delete statement(s),
+        which skips ORM relationship cascades and `before_delete`/`after_delete` events.
 
         Args:
-            async_session (AsyncSession         , required): SQLAlchemy
+            async_session (AsyncSession         , required): SQLAlchemy async_session for database connection.
             objects       (List[DeclarativeBase], required): List of ORM objects.
+            orm_way       (bool                 , optional): Use ORM way to delete objects (keeps ORM cascades and events). Defaults to False.
             auto_commit   (bool                 , optional): Auto commit. Defaults to False.
             warn_mode     (WarnEnum             , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -239,6 +271,15 @@ class AsyncDeleteMixin(AsyncReadMixin):
         if not orm_objects:
             raise EmptyValueError("No ORM objects provided to delete!")
 
+        if not orm_way:
+            await cls.async_delete_by_ids(
+                async_session=async_session,
+                ids=[_orm_object.id for _orm_object in orm_objects],
+                auto_commit=auto_commit,
+                warn_mode=warn_mode,
+            )
+            return
+
         try:
             for _orm_object in orm_objects:
                 await async_session.delete(_orm_object)
@@ -252,19 +293,14 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
             if isinstance(err, NoResultFound):
                 raise
-            elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            elif isinstance(err, IntegrityError):
+                cls._raise_integrity_error(err)
 
-            _message = f"Failed to delete `{cls.__name__}` objects from database!"
+            _message = "Failed to delete `{}` objects from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__)
 
             raise
 
@@ -279,8 +315,9 @@ class AsyncDeleteMixin(AsyncReadMixin):
         orm_way: bool = False,
         auto_commit: bool = False,
         allow_no_result: bool = False,
+        returning_ids: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
-    ) -> None:
+    ) -> Union[List[Any], None]:
         """Delete ORM objects from database by filter conditions.
 
         Args:
@@ -290,12 +327,18 @@ class AsyncDeleteMixin(AsyncReadMixin):
             orm_way         (bool                       , optional): Use ORM way to delete objects. Defaults to False.
             auto_commit     (bool                       , optional): Auto commit. Defaults to False.
             allow_no_result (bool                       , optional): Allow no result found. Defaults to False.
+            returning_ids   (bool                       , optional): Return deleted IDs (with `RETURNING id`). Defaults to False.
             warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             Exception: If failed to delete ORM objects from database by filter conditions.
+
+        Returns:
+            Union[List[Any], None]: List of deleted IDs if `returning_ids` is True, None otherwise.
         """
 
+        _deleted_ids: Union[List[Any], None] = None
+
         if orm_way:
             _orm_objects: List[cls] = await cls.async_select_by_where(
                 async_session=async_session,
@@ -305,9 +348,13 @@ class AsyncDeleteMixin(AsyncReadMixin):
             )
 
             if _orm_objects:
+                if returning_ids:
+                    _deleted_ids = [_orm_object.id for _orm_object in _orm_objects]
+
                 await cls.async_delete_objects(
                     async_session=async_session,
                     orm_objects=_orm_objects,
+                    orm_way=True,
                     auto_commit=auto_commit,
                     warn_mode=warn_mode,
                 )
@@ -317,18 +364,24 @@ class AsyncDeleteMixin(AsyncReadMixin):
                 )
         else:
             try:
-                _stmt: Delete = delete(cls)
-                _stmt = cls._build_where_stmt(stmt=_stmt, where=where)
-                _result: Result = await async_session.execute(_stmt)
+                ## Single round-trip, rows are not loaded into session:
+                _stmt, _params = cls._prepare_delete(
+                    where=where, returning_ids=returning_ids
+                )
+                _result: Result = await async_session.execute(_stmt, _params)
+                _rowcount = _result.rowcount
+                if returning_ids:
+                    _deleted_ids = _result.scalars().all()
+                    _rowcount = len(_deleted_ids)
 
                 if auto_commit:
                     await async_session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row(s) from `{}` ORM table.", _rowcount, cls.__name__
                 )
 
-                if (not allow_no_result) and (_result.rowcount == 0):
+                if (not allow_no_result) and (_rowcount == 0):
                     raise NoResultFound(
                         f"Not found any `{cls.__name__}` objects by '{where}' filter from database!"
                     )
@@ -339,29 +392,25 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
                 if isinstance(err, NoResultFound):
                     raise
-                elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
+                elif isinstance(err, IntegrityError):
+                    cls._raise_integrity_error(err)
 
-                _message = f"Failed to delete `{cls.__name__}` object by '{where}' filter from database!"
+                _message = "Failed to delete `{}` object by '{}' filter from database!"
                 if warn_mode == WarnEnum.ALWAYS:
-                    logger.error(_message)
+                    logger.error(_message, cls.__name__, where)
                 elif warn_mode == WarnEnum.DEBUG:
-                    logger.debug(_message)
+                    logger.debug(_message, cls.__name__, where)
 
                 raise
 
-        return
+        return _deleted_ids
 
     @classmethod
     @validate_call(config={"arbitrary_types_allowed": True})
     async def async_delete_all(
         cls,
         async_session: AsyncSession,
+        truncate: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
@@ -369,6 +418,7 @@ class AsyncDeleteMixin(AsyncReadMixin):
 
         Args:
             async_session (AsyncSession, required): SQLAlchemy async_session for database connection.
+            truncate      (bool        , optional): Use `TRUNCATE TABLE` if `config.db.allow_truncate` is enabled. Defaults to False.
             auto_commit   (bool        , optional): Auto commit. Defaults to False.
             warn_mode     (WarnEnum    , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -376,33 +426,53 @@ class AsyncDeleteMixin(AsyncReadMixin):
             Exception: If failed to delete all ORM objects from database.
         """
 
+        if truncate and (not config.db.allow_truncate):
+            logger.warning(
+                "`TRUNCATE` is not allowed by `config.db.allow_truncate`, deleting all rows from `{}` ORM table instead.",
+                cls.__name__,
+            )
+            truncate = False
+
         try:
-            _stmt = delete(cls)
-            _result: Result = await async_session.execute(_stmt)
+            ## `TRUNCATE` drops all rows at once instead of deleting row by row:
+            if truncate and (config.db.dialect != "sqlite"):
+                _dialect = async_session.get_bind().dialect
+                ## Quoted with dialect's identifier quotes, including table schema:
+                _table = _dialect.identifier_preparer.format_table(cls.__table__)
+                _sql = f"TRUNCATE TABLE {_table}"
+                if _dialect.name == "postgresql":
+                    _sql += " RESTART IDENTITY"
 
-            if auto_commit:
-                await async_session.commit()
+                await async_session.execute(text(_sql))
 
-            logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
-            )
+                if auto_commit:
+                    await async_session.commit()
+
+                logger.debug("Truncated `{}` ORM table.", cls.__name__)
+            else:
+                _stmt = delete(cls)
+                _result: Result = await async_session.execute(_stmt)
+
+                if auto_commit:
+                    await async_session.commit()
+
+                logger.debug(
+                    "Deleted '{}' row(s) from `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
+                )
         except Exception as err:
             if auto_commit:
                 await async_session.rollback()
 
-            if hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            if isinstance(err, IntegrityError):
+                cls._raise_integrity_error(err)
 
-            _message = f"Failed to delete all `{cls.__name__}` objects from database!"
+            _message = "Failed to delete all `{}` objects from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__)
 
             raise
 
@@ -10,21 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.constants import WarnEnum
 from api.config import config
-
-if config.db.dialect == "postgresql":
-    from psycopg.errors import (
-        NotNullViolation,
-        UniqueViolation,
-        ForeignKeyViolation,
-        CheckViolation,
-    )
-from api.core.exceptions import (
-    UniqueKeyError,
-    EmptyValueError,
-    NullConstraintError,
-    ForeignKeyError,
-    CheckConstraintError,
-)
+from api.core.exceptions import EmptyValueError
 from api.logger import logger
 
 from ._read import AsyncReadMixin
@@ -77,23 +63,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
             if isinstance(err, NoResultFound):
                 raise
             elif isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                self._raise_integrity_error(err)
 
             _message = f"Failed to update `{self.__class__.__name__}` object (self) '{self.id}' ID into database!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -195,23 +165,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
                 if isinstance(err, NoResultFound):
                     raise
                 elif isinstance(err, IntegrityError):
-                    if isinstance(err.orig, NotNullViolation):
-                        raise NullConstraintError(
-                            f"`{err.orig.diag.column_name}` cannot be NULL."
-                        )
-                    elif isinstance(err.orig, UniqueViolation):
-                        _detail = err.orig.diag.message_detail.replace("Key ", "")
-                        raise UniqueKeyError(_detail)
-                    elif isinstance(err.orig, ForeignKeyViolation):
-                        _detail = (
-                            err.orig.diag.message_detail.replace("Key ", "")
-                            .replace('"', "'")
-                            .replace(f"table '{config.db.prefix}", "'")
-                        )
-                        raise ForeignKeyError(_detail)
-                    elif isinstance(err.orig, CheckViolation):
-                        _detail = err.orig.diag.message_detail.replace("Key ", "")
-                        raise CheckConstraintError(_detail)
+                    cls._raise_integrity_error(err)
 
                 _message = f"Failed to update `{cls.__name__}` object with '{id}' ID into database!"
                 if warn_mode == WarnEnum.ALWAYS:
@@ -301,23 +255,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
             if isinstance(err, NoResultFound):
                 raise
             elif isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                cls._raise_integrity_error(err)
 
             _message = f"Failed to update `{cls.__name__}` objects by '{ids}' IDs into database!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -385,23 +323,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
             if isinstance(err, NoResultFound):
                 raise
             elif isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                cls._raise_integrity_error(err)
 
             _message = f"Failed to update `{cls.__name__}` objects into database!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -503,23 +425,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
                     await async_session.rollback()
 
                 if isinstance(err, IntegrityError):
-                    if isinstance(err.orig, NotNullViolation):
-                        raise NullConstraintError(
-                            f"`{err.orig.diag.column_name}` cannot be NULL."
-                        )
-                    elif isinstance(err.orig, UniqueViolation):
-                        _detail = err.orig.diag.message_detail.replace("Key ", "")
-                        raise UniqueKeyError(_detail)
-                    elif isinstance(err.orig, ForeignKeyViolation):
-                        _detail = (
-                            err.orig.diag.message_detail.replace("Key ", "")
-                            .replace('"', "'")
-                            .replace(f"table '{config.db.prefix}", "'")
-                        )
-                        raise ForeignKeyError(_detail)
-                    elif isinstance(err.orig, CheckViolation):
-                        _detail = err.orig.diag.message_detail.replace("Key ", "")
-                        raise CheckConstraintError(_detail)
+                    cls._raise_integrity_error(err)
 
                 _message = f"Failed to update `{cls.__name__}` object(s) by '{where}' filter into database!"
                 if warn_mode == WarnEnum.ALWAYS:
@@ -583,23 +489,7 @@ class AsyncUpdateMixin(AsyncReadMixin):
                 await async_session.rollback()
 
             if isinstance(err, IntegrityError):
-                if isinstance(err.orig, NotNullViolation):
-                    raise NullConstraintError(
-                        f"`{err.orig.diag.column_name}` cannot be NULL."
-                    )
-                elif isinstance(err.orig, UniqueViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise UniqueKeyError(_detail)
-                elif isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
-                elif isinstance(err.orig, CheckViolation):
-                    _detail = err.orig.diag.message_detail.replace("Key ", "")
-                    raise CheckConstraintError(_detail)
+                cls._raise_integrity_error(err)
 
             _message = f"Failed to update all `{cls.__name__}` objects into database!"
             if warn_mode == WarnEnum.ALWAYS:
@@ -3,16 +3,13 @@
 from typing import List, Dict, Union, Any
 
 from pydantic import validate_call
-from sqlalchemy import Delete, delete, Result
+from sqlalchemy import Delete, delete, Result, text
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin, Session
-from sqlalchemy.exc import NoResultFound
+from sqlalchemy.exc import NoResultFound, IntegrityError
 
 from api.core.constants import WarnEnum
 from api.config import config
-
-if config.db.dialect == "postgresql":
-    from psycopg.errors import ForeignKeyViolation
-from api.core.exceptions import EmptyValueError, ForeignKeyError
+from api.core.exceptions import EmptyValueError
 from api.logger import logger
 
 from ._read import ReadMixin
@@ -24,13 +21,17 @@ class DeleteMixin(ReadMixin):
     def delete(
         self,
         session: Session,
+        orm_way: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
         """Delete ORM object from database.
+        By default object is deleted by its ID with delete statement (without session
+        unit-of-work flush), then expunged from session.
 
         Args:
             session     (Session , required): SQLAlchemy session for database connection.
+            orm_way     (bool    , optional): Use ORM way to delete object (keeps ORM cascades and events). Defaults to False.
             auto_commit (bool    , optional): Auto commit. Defaults to False.
             warn_mode   (WarnEnum, optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -39,6 +40,18 @@ class DeleteMixin(ReadMixin):
             Exception    : If failed to delete ORM object from database.
         """
 
+        if not orm_way:
+            self.__class__.delete_by_id(
+                session=session,
+                id=self.id,
+                auto_commit=auto_commit,
+                warn_mode=warn_mode,
+            )
+            if self in session:
+                session.expunge(self)
+
+            return
+
         try:
             session.delete(self)
 
@@ -51,19 +64,14 @@ class DeleteMixin(ReadMixin):
 
             if isinstance(err, NoResultFound):
                 raise
-            elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            elif isinstance(err, IntegrityError):
+                self._raise_integrity_error(err)
 
-            _message = f"Failed to delete `{self.__class__.__name__}` object (self) '{self.id}' ID from database!"
+            _message = "Failed to delete `{}` object (self) '{}' ID from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, self.__class__.__name__, self.id)
             elif warn_mode == WarnEnum.ONCE:
-                logger.warning(_message)
+                logger.warning(_message, self.__class__.__name__, self.id)
 
             raise
 
@@ -96,22 +104,29 @@ class DeleteMixin(ReadMixin):
             _orm_object: cls = cls.get(session=session, id=id, warn_mode=warn_mode)
             _orm_object.delete(
                 session=session,
+                orm_way=True,
                 auto_commit=auto_commit,
                 warn_mode=warn_mode,
             )
         else:
             try:
-                _stmt: Delete = delete(cls).where(cls.id == id)
-                _result: Result = session.execute(_stmt)
+                _stmt: Delete = cls._get_stmt_by_id(stmt_type="delete")
+                _result: Result = session.execute(_stmt, {"id": id})
+                if _result.returns_rows:
+                    _is_deleted = _result.scalar_one_or_none() is not None
+                else:
+                    _is_deleted = 0 < _result.rowcount
 
                 if auto_commit:
                     session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row from `{}` ORM table.",
+                    int(_is_deleted),
+                    cls.__name__,
                 )
 
-                if _result.rowcount == 0:
+                if not _is_deleted:
                     raise NoResultFound(
                         f"Not found any `{cls.__name__}` object with '{id}' ID from database!"
                     )
@@ -122,21 +137,14 @@ class DeleteMixin(ReadMixin):
 
                 if isinstance(err, NoResultFound):
                     raise
-                elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
+                elif isinstance(err, IntegrityError):
+                    cls._raise_integrity_error(err)
 
-                _message = (
-                    f"Failed to delete `{cls.__name__}` object '{id}' ID from database!"
-                )
+                _message = "Failed to delete `{}` object '{}' ID from database!"
                 if warn_mode == WarnEnum.ALWAYS:
-                    logger.error(_message)
+                    logger.error(_message, cls.__name__, id)
                 elif warn_mode == WarnEnum.DEBUG:
-                    logger.debug(_message)
+                    logger.debug(_message, cls.__name__, id)
 
                 raise
 
@@ -148,16 +156,20 @@ class DeleteMixin(ReadMixin):
         cls,
         session: Session,
         ids: List[str],
+        batch_size: int = config.db.delete_batch_size,
+        skip_failed_batch: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
-        """Delete rows/ORM objects from database by ID list.
+        """Delete rows/ORM objects from database by ID list, in batches of `batch_size` IDs per statement.
 
         Args:
-            session     (Session  , required): SQLAlchemy session for database connection.
-            ids         (List[str], required): List of IDs.
-            auto_commit (bool     , optional): Auto commit. Defaults to False.
-            warn_mode   (WarnEnum , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+            session           (Session  , required): SQLAlchemy session for database connection.
+            ids               (List[str], required): List of IDs.
+            batch_size        (int      , optional): Max IDs per delete statement. Defaults to `config.db.delete_batch_size`.
+            skip_failed_batch (bool     , optional): Run each batch in SAVEPOINT, log and skip failed batches. Defaults to False.
+            auto_commit       (bool     , optional): Auto commit. Defaults to False.
+            warn_mode         (WarnEnum , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             EmptyValueError: If no IDs provided to delete.
@@ -168,18 +180,39 @@ class DeleteMixin(ReadMixin):
         if not ids:
             raise EmptyValueError("No IDs provided to delete!")
 
+        ## Remove duplicate IDs and keep order:
+        ids = list(dict.fromkeys(ids))
+
         try:
-            _stmt: Delete = delete(cls).where(cls.id.in_(ids))
-            _result: Result = session.execute(_stmt)
+            _rowcount = 0
+            _stmt: Delete = cls._get_stmt_by_id(stmt_type="delete", is_many=True)
+            for _i in range(0, len(ids), batch_size):
+                _params = {"ids": ids[_i : (_i + batch_size)]}
+                if skip_failed_batch:
+                    ## Run each batch in SAVEPOINT, so failed batch doesn't abort others:
+                    try:
+                        with session.begin_nested():
+                            _result: Result = session.execute(_stmt, _params)
+                    except Exception:
+                        logger.warning(
+                            "Failed to delete `{}` objects batch with '{}' IDs, skipped!",
+                            cls.__name__,
+                            _params["ids"],
+                        )
+                        continue
+                else:
+                    _result: Result = session.execute(_stmt, _params)
+
+                _rowcount += _result.rowcount
 
-            if auto_commit:
-                session.commit()
+                if auto_commit:
+                    session.commit()
 
             logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                "Deleted '{}' row(s) from `{}` ORM table.", _rowcount, cls.__name__
             )
 
-            if _result.rowcount == 0:
+            if _rowcount == 0:
                 raise NoResultFound(
                     f"Not found any `{cls.__name__}` objects with '{ids}' IDs from database!"
                 )
@@ -190,19 +223,14 @@ class DeleteMixin(ReadMixin):
 
             if isinstance(err, NoResultFound):
                 raise
-            elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            elif isinstance(err, IntegrityError):
+                cls._raise_integrity_error(err)
 
-            _message = f"Failed to delete `{cls.__name__}` objects by '{ids}' IDs from database!"
+            _message = "Failed to delete `{}` objects by '{}' IDs from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, ids)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, ids)
 
             raise
 
@@ -214,14 +242,18 @@ class DeleteMixin(ReadMixin):
         cls,
         session: Session,
         orm_objects: List[DeclarativeBase],
+        orm_way: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
         """Delete ORM objects from database.
+        By default all objects are deleted by their IDs with bulk delete statement(s),
+        which skips ORM relationship cascades and `before_delete`/`after_delete` events.
 
         Args:
-            session     (Session              , required): SQLAlchemy
+            session     (Session              , required): SQLAlchemy session for database connection.
             objects     (List[DeclarativeBase], required): List of ORM objects.
+            orm_way     (bool                 , optional): Use ORM way to delete objects (keeps ORM cascades and events). Defaults to False.
             auto_commit (bool                 , optional): Auto commit. Defaults to False.
             warn_mode   (WarnEnum             , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -234,6 +266,15 @@ class DeleteMixin(ReadMixin):
         if not orm_objects:
             raise EmptyValueError("No ORM objects provided to delete!")
 
+        if not orm_way:
+            cls.delete_by_ids(
+                session=session,
+                ids=[_orm_object.id for _orm_object in orm_objects],
+                auto_commit=auto_commit,
+                warn_mode=warn_mode,
+            )
+            return
+
         try:
             for _orm_object in orm_objects:
                 session.delete(_orm_object)
@@ -247,19 +288,14 @@ class DeleteMixin(ReadMixin):
 
             if isinstance(err, NoResultFound):
                 raise
-            elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            elif isinstance(err, IntegrityError):
+                cls._raise_integrity_error(err)
 
-            _message = f"Failed to delete `{cls.__name__}` objects from database!"
+            _message = "Failed to delete `{}` objects from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__)
 
             raise
 
@@ -274,8 +310,9 @@ class DeleteMixin(ReadMixin):
         orm_way: bool = False,
         auto_commit: bool = False,
         allow_no_result: bool = False,
+        returning_ids: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
-    ) -> None:
+    ) -> Union[List[Any], None]:
         """Delete ORM objects from database by filter conditions.
 
         Args:
@@ -285,12 +322,18 @@ class DeleteMixin(ReadMixin):
             orm_way         (bool                       , optional): Use ORM way to delete objects. Defaults to False.
             auto_commit     (bool                       , optional): Auto commit. Defaults to False.
             allow_no_result (bool                       , optional): Allow no result found. Defaults to False.
+            returning_ids   (bool                       , optional): Return deleted IDs (with `RETURNING id`). Defaults to False.
             warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
         Raises:
             Exception: If failed to delete ORM objects from database by filter conditions.
+
+        Returns:
+            Union[List[Any], None]: List of deleted IDs if `returning_ids` is True, None otherwise.
         """
 
+        _deleted_ids: Union[List[Any], None] = None
+
         if orm_way:
             _orm_objects: List[cls] = cls.select_by_where(
                 session=session,
@@ -300,9 +343,13 @@ class DeleteMixin(ReadMixin):
             )
 
             if _orm_objects:
+                if returning_ids:
+                    _deleted_ids = [_orm_object.id for _orm_object in _orm_objects]
+
                 cls.delete_objects(
                     session=session,
                     orm_objects=_orm_objects,
+                    orm_way=True,
                     auto_commit=auto_commit,
                     warn_mode=warn_mode,
                 )
@@ -312,18 +359,24 @@ class DeleteMixin(ReadMixin):
                 )
         else:
             try:
-                _stmt: Delete = delete(cls)
-                _stmt = cls._build_where_stmt(stmt=_stmt, where=where)
-                _result: Result = session.execute(_stmt)
+                ## Single round-trip, rows are not loaded into session:
+                _stmt, _params = cls._prepare_delete(
+                    where=where, returning_ids=returning_ids
+                )
+                _result: Result = session.execute(_stmt, _params)
+                _rowcount = _result.rowcount
+                if returning_ids:
+                    _deleted_ids = _result.scalars().all()
+                    _rowcount = len(_deleted_ids)
 
                 if auto_commit:
                     session.commit()
 
                 logger.debug(
-                    f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
+                    "Deleted '{}' row(s) from `{}` ORM table.", _rowcount, cls.__name__
                 )
 
-                if (not allow_no_result) and (_result.rowcount == 0):
+                if (not allow_no_result) and (_rowcount == 0):
                     raise NoResultFound(
                         f"Not found any `{cls.__name__}` objects by '{where}' filter from database!"
                     )
@@ -334,29 +387,25 @@ class DeleteMixin(ReadMixin):
 
                 if isinstance(err, NoResultFound):
                     raise
-                elif hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                    _detail = (
-                        err.orig.diag.message_detail.replace("Key ", "")
-                        .replace('"', "'")
-                        .replace(f"table '{config.db.prefix}", "'")
-                    )
-                    raise ForeignKeyError(_detail)
+                elif isinstance(err, IntegrityError):
+                    cls._raise_integrity_error(err)
 
-                _message = f"Failed to delete `{cls.__name__}` object by '{where}' filter from database!"
+                _message = "Failed to delete `{}` object by '{}' filter from database!"
                 if warn_mode == WarnEnum.ALWAYS:
-                    logger.error(_message)
+                    logger.error(_message, cls.__name__, where)
                 elif warn_mode == WarnEnum.DEBUG:
-                    logger.debug(_message)
+                    logger.debug(_message, cls.__name__, where)
 
                 raise
 
-        return
+        return _deleted_ids
 
     @classmethod
     @validate_call(config={"arbitrary_types_allowed": True})
     def delete_all(
         cls,
         session: Session,
+        truncate: bool = False,
         auto_commit: bool = False,
         warn_mode: WarnEnum = WarnEnum.DEBUG,
     ) -> None:
@@ -364,6 +413,7 @@ class DeleteMixin(ReadMixin):
 
         Args:
             session     (Session , required): SQLAlchemy session for database connection.
+            truncate    (bool    , optional): Use `TRUNCATE TABLE` if `config.db.allow_truncate` is enabled. Defaults to False.
             auto_commit (bool    , optional): Auto commit. Defaults to False.
             warn_mode   (WarnEnum, optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
 
@@ -371,33 +421,53 @@ class DeleteMixin(ReadMixin):
             Exception: If failed to delete all ORM objects from database.
         """
 
+        if truncate and (not config.db.allow_truncate):
+            logger.warning(
+                "`TRUNCATE` is not allowed by `config.db.allow_truncate`, deleting all rows from `{}` ORM table instead.",
+                cls.__name__,
+            )
+            truncate = False
+
         try:
-            _stmt = delete(cls)
-            _result: Result = session.execute(_stmt)
+            ## `TRUNCATE` drops all rows at once instead of deleting row by row:
+            if truncate and (config.db.dialect != "sqlite"):
+                _dialect = session.get_bind().dialect
+                ## Quoted with dialect's identifier quotes, including table schema:
+                _table = _dialect.identifier_preparer.format_table(cls.__table__)
+                _sql = f"TRUNCATE TABLE {_table}"
+                if _dialect.name == "postgresql":
+                    _sql += " RESTART IDENTITY"
 
-            if auto_commit:
-                session.commit()
+                session.execute(text(_sql))
 
-            logger.debug(
-                f"Deleted '{_result.rowcount}' row(s) from `{cls.__name__}` ORM table."
-            )
+                if auto_commit:
+                    session.commit()
+
+                logger.debug("Truncated `{}` ORM table.", cls.__name__)
+            else:
+                _stmt = delete(cls)
+                _result: Result = session.execute(_stmt)
+
+                if auto_commit:
+                    session.commit()
+
+                logger.debug(
+                    "Deleted '{}' row(s) from `{}` ORM table.",
+                    _result.rowcount,
+                    cls.__name__,
+                )
         except Exception as err:
             if auto_commit:
                 session.rollback()
 
-            if hasattr(err, "orig") and isinstance(err.orig, ForeignKeyViolation):
-                _detail = (
-                    err.orig.diag.message_detail.replace("Key ", "")
-                    .replace('"', "'")
-                    .replace(f"table '{config.db.prefix}", "'")
-                )
-                raise ForeignKeyError(_detail)
+            if isinstance(err, IntegrityError):
+                cls._raise_integrity_error(err)
 
-            _message = f"Failed to delete all `{cls.__name__}` objects from database!"
+            _message = "Failed to delete all `{}` objects from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__)
 
             raise
 
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union, List, Dict, Any, Optional
+from typing import Union, List, Dict, Any, Optional, Iterator
 
 from pydantic import validate_call
-from sqlalchemy import Select, select, Result, func
+from sqlalchemy import Select, select, Result, ScalarResult, RowMapping
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import DeclarativeBase, declarative_mixin, Session
 
@@ -56,7 +56,7 @@ class ReadMixin(BaseMixin):
 
         _orm_objects: List[cls] = []
         try:
-            _stmt: Select = cls._build_select(
+            _stmt, _params = cls._prepare_select(
                 where=where,
                 offset=offset,
                 limit=limit,
@@ -66,17 +66,19 @@ class ReadMixin(BaseMixin):
                 disable_limit=disable_limit,
             )
 
-            _result: Result = session.execute(_stmt)
+            _result: Result = session.execute(_stmt, _params)
             if joins:
                 _result = _result.unique()
 
             _orm_objects: List[cls] = _result.scalars().all()
         except Exception:
-            _message = f"Failed to get `{cls.__name__}` objects from database by filtering with '{where}'!"
+            _message = (
+                "Failed to get `{}` objects from database by filtering with '{}'!"
+            )
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, where)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, where)
 
             raise
 
@@ -87,6 +89,55 @@ class ReadMixin(BaseMixin):
 
         return _orm_objects
 
+    @classmethod
+    def stream_by_where(
+        cls,
+        session: Session,
+        where: Union[List[Dict[str, Any]], Dict[str, Any]],
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        yield_per: int = config.db.ids_chunk_size,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> Iterator[DeclarativeBase]:
+        """Stream all ORM objects from database by where filter conditions, fetched in chunks with server-side cursor.
+
+        Args:
+            session   (Session                    , required): SQLAlchemy session for database connection.
+            where     (Union[List[Dict[str, Any]],
+                                   Dict[str, Any]], required): List of filter conditions.
+            order_by  (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc   (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            yield_per (int                        , optional): Number of objects to fetch per chunk. Defaults to `config.db.ids_chunk_size`.
+            warn_mode (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            Exception: If failed to stream ORM objects from database by where filter conditions.
+
+        Yields:
+            Iterator[DeclarativeBase]: ORM objects one by one.
+        """
+
+        try:
+            _stmt, _params = cls._prepare_select(
+                where=where, order_by=order_by, is_desc=is_desc, disable_limit=True
+            )
+            _stmt: Select = _stmt.execution_options(yield_per=yield_per)
+
+            _scalars: ScalarResult = session.scalars(_stmt, _params)
+            for _orm_object in _scalars:
+                yield _orm_object
+
+        except Exception:
+            _message = (
+                "Failed to stream `{}` objects from database by filtering with '{}'!"
+            )
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message, cls.__name__, where)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message, cls.__name__, where)
+
+            raise
+
     @classmethod
     @validate_call(config={"arbitrary_types_allowed": True})
     def select(
@@ -132,16 +183,83 @@ class ReadMixin(BaseMixin):
                 warn_mode=WarnEnum.IGNORE,
             )
         except Exception:
-            _message = f"Failed to get `{cls.__name__}` objects from database!"
+            _message = "Failed to get `{}` objects from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__)
 
             raise
 
         return _orm_objects
 
+    @classmethod
+    @validate_call(config={"arbitrary_types_allowed": True})
+    def select_as_dicts(
+        cls,
+        session: Session,
+        where: Union[List[Dict[str, Any]], Dict[str, Any], None] = None,
+        offset: int = 0,
+        limit: int = config.db.select_limit,
+        order_by: Union[List[str], str, None] = None,
+        is_desc: bool = True,
+        disable_limit: bool = False,
+        allow_no_result: bool = True,
+        warn_mode: WarnEnum = WarnEnum.DEBUG,
+    ) -> List[RowMapping]:
+        """Select all columns of rows as dict-like mappings from database, without creating ORM objects.
+        For read-only results (e.g. serialized into response) it skips ORM identity map and `to_dict()`.
+
+        Args:
+            session         (Session                    , required): SQLAlchemy session for database connection.
+            where           (Union[List[Dict[str, Any]],
+                                   Dict[str, Any], None], optional): List of filter conditions. Defaults to None.
+            offset          (int                        , optional): Number of rows to skip. Defaults to 0.
+            limit           (int                        , optional): Number of rows to limit. Defaults to `config.db.select_limit`.
+            order_by        (Union[List[str], str, None], optional): List of order by columns. Defaults to None.
+            is_desc         (bool                       , optional): Is sort descending or ascending. Defaults to True.
+            disable_limit   (bool                       , optional): Disable select limit. Defaults to False.
+            allow_no_result (bool                       , optional): Allow no result. Defaults to True.
+            warn_mode       (WarnEnum                   , optional): Warning mode. Defaults to `WarnEnum.DEBUG`.
+
+        Raises:
+            NoResultFound: If no result found and `allow_no_result` is False.
+            Exception    : If failed to get rows from database.
+
+        Returns:
+            List[RowMapping]: List of dict-like rows, keyed by column names.
+        """
+
+        _rows: List[RowMapping] = []
+        try:
+            _stmt, _params = cls._prepare_select(
+                where=where,
+                offset=offset,
+                limit=limit,
+                order_by=order_by,
+                is_desc=is_desc,
+                disable_limit=disable_limit,
+            )
+            _stmt: Select = _stmt.with_only_columns(*cls.__table__.columns)
+
+            _result: Result = session.execute(_stmt, _params)
+            _rows: List[RowMapping] = _result.mappings().all()
+        except Exception:
+            _message = "Failed to get `{}` rows from database by filtering with '{}'!"
+            if warn_mode == WarnEnum.ALWAYS:
+                logger.error(_message, cls.__name__, where)
+            elif warn_mode == WarnEnum.DEBUG:
+                logger.debug(_message, cls.__name__, where)
+
+            raise
+
+        if (not allow_no_result) and (not _rows):
+            raise NoResultFound(
+                f"Not found any `{cls.__name__}` rows from database by filtering with '{where}'!"
+            )
+
+        return _rows
+
     @classmethod
     @validate_call(config={"arbitrary_types_allowed": True})
     def get(
@@ -171,13 +289,11 @@ class ReadMixin(BaseMixin):
         try:
             _orm_object: Union[cls, None] = session.get(cls, id)
         except Exception:
-            _message = (
-                f"Failed to get `{cls.__name__}` object with '{id}' ID from database!"
-            )
+            _message = "Failed to get `{}` object with '{}' ID from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, id)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, id)
 
             raise
 
@@ -210,7 +326,7 @@ class ReadMixin(BaseMixin):
 
         Raises:
             NoResultFound: If no result found and `allow_no_result` is False.
-            Exception    : Any exception from `select_by_where()`.
+            Exception    : If failed to get ORM object from database by where filter conditions.
 
         Returns:
             Union[DeclarativeBase, None]: ORM object or None.
@@ -218,27 +334,25 @@ class ReadMixin(BaseMixin):
 
         _orm_object: Union[cls, None] = None
         try:
-            _orm_objects: List[cls] = cls.select_by_where(
-                session=session,
-                where=where,
-                limit=1,
-                joins=joins,
-                allow_no_result=allow_no_result,
-                warn_mode=WarnEnum.IGNORE,
-            )
-        except NoResultFound:
-            raise
+            _stmt, _params = cls._prepare_select_one(where=where, joins=joins)
+            _result: Result = session.execute(_stmt, _params)
+            if joins:
+                _result = _result.unique()
+
+            _orm_object: Union[cls, None] = _result.scalar_one_or_none()
         except Exception:
-            _message = f"Failed to get `{cls.__name__}` object from database by filtering with '{where}'!"
+            _message = "Failed to get `{}` object from database by filtering with '{}'!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, where)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, where)
 
             raise
 
-        if _orm_objects:
-            _orm_object: cls = _orm_objects[0]
+        if (not allow_no_result) and (not _orm_object):
+            raise NoResultFound(
+                f"Not found any `{cls.__name__}` object from database by filtering with '{where}'!"
+            )
 
         return _orm_object
 
@@ -266,12 +380,28 @@ class ReadMixin(BaseMixin):
         if not ids:
             raise EmptyValueError("No IDs provided to select!")
 
+        ## Remove duplicate IDs and keep order:
+        ids = list(dict.fromkeys(ids))
+        _chunk_size = config.db.ids_chunk_size
+
         _orm_objects: List[cls] = []
         try:
-            _stmt: Select = select(cls).where(cls.id.in_(ids))
-            _result: Result = session.execute(_stmt)
-            _orm_objects: List[cls] = _result.scalars().all()
+            ## Select only IDs which are not already loaded in session:
+            _loaded_objects, _missing_ids = cls._split_loaded_ids(
+                session=session, ids=ids
+            )
+
+            _stmt: Select = cls._get_stmt_by_id(is_many=True)
+            for _i in range(0, len(_missing_ids), _chunk_size):
+                _scalars: ScalarResult = session.scalars(
+                    _stmt, {"ids": _missing_ids[_i : (_i + _chunk_size)]}
+                )
+                for _orm_object in _scalars:
+                    _loaded_objects[str(_orm_object.id)] = _orm_object
 
+            _orm_objects: List[cls] = [
+                _loaded_objects[str(_id)] for _id in ids if str(_id) in _loaded_objects
+            ]
             if not _orm_objects:
                 raise NoResultFound(
                     f"Not found any `{cls.__name__}` objects with '{ids}' IDs from database!"
@@ -280,11 +410,11 @@ class ReadMixin(BaseMixin):
         except NoResultFound:
             raise
         except Exception:
-            _message = f"Failed to get `{cls.__name__}` objects with '{ids}' IDs from database!"
+            _message = "Failed to get `{}` objects with '{}' IDs from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, ids)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, ids)
 
             raise
 
@@ -317,11 +447,11 @@ class ReadMixin(BaseMixin):
                 _is_exists = True
 
         except Exception:
-            _message = f"Failed to check if `{cls.__name__}` object by '{id}' ID exists in database!"
+            _message = "Failed to check if `{}` object by '{}' ID exists in database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, id)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, id)
 
             raise
 
@@ -350,11 +480,11 @@ class ReadMixin(BaseMixin):
                 warn_mode=WarnEnum.IGNORE,
             )
         except Exception:
-            _message = f"Failed to check if `{self.__class__.__name__}` object '{self.id}' ID exists in database!"
+            _message = "Failed to check if `{}` object '{}' ID exists in database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, self.__class__.__name__, self.id)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, self.__class__.__name__, self.id)
 
             raise
 
@@ -385,18 +515,15 @@ class ReadMixin(BaseMixin):
 
         _count = 0
         try:
-            _stmt: Select = select(func.count()).select_from(cls)
-            if where:
-                _stmt: Select = cls._build_where(stmt=_stmt, where=where)
-
-            _result: Result = session.execute(_stmt)
+            _stmt, _params = cls._prepare_count(where=where)
+            _result: Result = session.execute(_stmt, _params)
             _count: int = _result.scalar()
         except Exception:
-            _message = f"Failed to count `{cls.__name__}` objects by '{where}' filter in database!"
+            _message = "Failed to count `{}` objects by '{}' filter in database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__, where)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__, where)
 
             raise
 
@@ -426,11 +553,11 @@ class ReadMixin(BaseMixin):
                 warn_mode=WarnEnum.IGNORE,
             )
         except Exception:
-            _message = f"Failed to count all `{cls.__name__}` objects from database!"
+            _message = "Failed to count all `{}` objects from database!"
             if warn_mode == WarnEnum.ALWAYS:
-                logger.error(_message)
+                logger.error(_message, cls.__name__)
             elif warn_mode == WarnEnum.DEBUG:
-                logger.debug(_message)
+                logger.debug(_message, cls.__name__)
 
             raise
 
@@ -3,6 +3,7 @@
 from http import HTTPStatus
 from typing import Any, Optional, Dict, Type
 
+import orjson
 from pydantic import validate_call, conint, constr
 from starlette.background import BackgroundTask
 from fastapi import Request
@@ -127,5 +128,17 @@ class BaseResponse(JSONResponse):
             background=background,
         )
 
+    def render(self, content: Any) -> bytes:
+        """Serialize response content into JSON bytes with `orjson` instead of stdlib `json`.
+
+        Args:
+            content (Any, required): JSON compatible response content.
+
+        Returns:
+            bytes: Serialized JSON content.
+        """
+
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 __all__ = ["BaseResponse"]
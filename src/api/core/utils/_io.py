@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import errno
 import shutil
+import asyncio
 import hashlib
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, BinaryIO
 
 import aioshutil
 import aiofiles.os
@@ -15,6 +19,94 @@ from api.core.constants import WarnEnum, HashAlgoEnum
 
 
 _path_max_length = 1024
+_aio_chunk_size = 1_048_576  # 1 MiB
+_aio_queue_depth = 8
+
+
+async def _async_aio_update_hash(
+    file_hash: "hashlib._Hash", file_path: str, chunk_size: int
+) -> None:
+    """Feed file content into hash object with batched kernel async reads (Linux only, requires `caio`).
+    Up to `_aio_queue_depth` concurrent `pread` requests are kept in flight and
+    completed buffers are hashed in issue order.
+
+    Args:
+        file_hash  (hashlib._Hash, required): Hash object to update.
+        file_path  (str          , required): Target file path.
+        chunk_size (int          , required): Read size of each request.
+    """
+
+    from caio import AsyncioContext
+
+    _fd = os.open(file_path, os.O_RDONLY)
+    _context = AsyncioContext(max_requests=_aio_queue_depth)
+    _pending: deque = deque()
+    try:
+        _file_size = os.fstat(_fd).st_size
+        for _offset in range(0, _file_size, chunk_size):
+            _pending.append(
+                asyncio.ensure_future(_context.read(chunk_size, _fd, _offset))
+            )
+            if _aio_queue_depth <= len(_pending):
+                file_hash.update(await _pending.popleft())
+
+        while _pending:
+            file_hash.update(await _pending.popleft())
+    finally:
+        for _future in _pending:
+            _future.cancel()
+
+        _context.close()
+        os.close(_fd)
+
+    return
+
+
+def _pipeline_update_hash(
+    file_hash: "hashlib._Hash", file: BinaryIO, chunk_size: int
+) -> None:
+    """Feed file content into hash object by overlapping reads and hashing with two buffers.
+    Reader thread fills the next buffer while the current buffer is hashed.
+
+    Args:
+        file_hash  (hashlib._Hash, required): Hash object to update.
+        file       (BinaryIO     , required): Opened binary file object.
+        chunk_size (int          , required): Buffer size.
+    """
+
+    _buffers = (bytearray(chunk_size), bytearray(chunk_size))
+    _views = (memoryview(_buffers[0]), memoryview(_buffers[1]))
+    with ThreadPoolExecutor(max_workers=1) as _executor:
+        _index = 0
+        _future = _executor.submit(file.readinto, _buffers[_index])
+        while True:
+            _read_size = _future.result()
+            if not _read_size:
+                break
+
+            _next_index = 1 - _index
+            _future = _executor.submit(file.readinto, _buffers[_next_index])
+            file_hash.update(_views[_index][:_read_size])
+            _index = _next_index
+
+    return
+
+
+def _pipeline_update_file_hash(
+    file_hash: "hashlib._Hash", file_path: str, chunk_size: int
+) -> None:
+    """Open file and feed its content into hash object with `_pipeline_update_hash()`.
+
+    Args:
+        file_hash  (hashlib._Hash, required): Hash object to update.
+        file_path  (str          , required): Target file path.
+        chunk_size (int          , required): Buffer size.
+    """
+
+    with open(file_path, "rb") as _file:
+        _pipeline_update_hash(file_hash=file_hash, file=_file, chunk_size=chunk_size)
+
+    return
 
 
 ## Async:
@@ -42,7 +134,8 @@ async def async_create_dir(
             elif warn_mode == WarnEnum.DEBUG:
                 logger.debug(_message)
 
-            await aiofiles.os.makedirs(create_dir)
+            ## Directory created concurrently after the check isn't an error:
+            await aiofiles.os.makedirs(create_dir, exist_ok=True)
         except OSError as err:
             if (err.errno == errno.EEXIST) and (warn_mode == WarnEnum.DEBUG):
                 logger.debug(f"'{create_dir}' directory already exists!")
@@ -101,7 +194,7 @@ async def async_remove_dir(
             logger.debug(_message)
 
     elif warn_mode == WarnEnum.ERROR:
-        raise OSError(errno.ENOENT, f"'{create_dir}' directory doesn't exist!")
+        raise OSError(errno.ENOENT, f"'{remove_dir}' directory doesn't exist!")
 
     return
 
@@ -191,15 +284,20 @@ async def async_get_file_checksum(
     file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
     hash_method: HashAlgoEnum = HashAlgoEnum.md5,
     chunk_size: conint(ge=10) = 4096,  # type: ignore
+    use_io_uring: bool = False,
+    use_pipeline: bool = False,
     warn_mode: WarnEnum = WarnEnum.DEBUG,
 ) -> str:
     """Asynchronous get file checksum.
 
     Args:
-        file_path   (str         , required): Target file path.
-        hash_method (HashAlgoEnum, optional): Hash method. Defaults to `HashAlgoEnum.md5`.
-        chunk_size  (int         , optional): Chunk size. Defaults to 4096.
-        warn_mode   (str         , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+        file_path    (str         , required): Target file path.
+        hash_method  (HashAlgoEnum, optional): Hash method. Defaults to `HashAlgoEnum.md5`.
+        chunk_size   (int         , optional): Chunk size. Defaults to 4096.
+        use_io_uring (bool        , optional): Use batched kernel async reads (Linux only, requires `caio`),
+                                                falls back to default reads if not available. Defaults to False.
+        use_pipeline (bool        , optional): Overlap next chunk read with current chunk hashing. Defaults to False.
+        warn_mode    (str         , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
 
     Raises:
         OSError: When warning mode is set to ERROR and file doesn't exist.
@@ -211,12 +309,34 @@ async def async_get_file_checksum(
     _file_checksum: str = None
     if await aiofiles.os.path.isfile(file_path):
         _file_hash = hashlib.new(hash_method.value)
-        async with aiofiles.open(file_path, "rb") as _file:
-            while True:
-                _file_chunk = await _file.read(chunk_size)
-                if not _file_chunk:
-                    break
-                _file_hash.update(_file_chunk)
+
+        _is_aio_read = False
+        if use_io_uring and sys.platform.startswith("linux"):
+            try:
+                await _async_aio_update_hash(
+                    file_hash=_file_hash,
+                    file_path=file_path,
+                    chunk_size=max(chunk_size, _aio_chunk_size),
+                )
+                _is_aio_read = True
+            except ImportError:
+                logger.debug("Not found 'caio' package, using default file reads.")
+
+        if (not _is_aio_read) and use_pipeline:
+            ## Hashing on event loop would block it, so reads and hashing overlap in threads:
+            await asyncio.to_thread(
+                _pipeline_update_file_hash,
+                file_hash=_file_hash,
+                file_path=file_path,
+                chunk_size=chunk_size,
+            )
+        elif not _is_aio_read:
+            async with aiofiles.open(file_path, "rb") as _file:
+                while True:
+                    _file_chunk = await _file.read(chunk_size)
+                    if not _file_chunk:
+                        break
+                    _file_hash.update(_file_chunk)
 
         _file_checksum = _file_hash.hexdigest()
     else:
@@ -256,7 +376,8 @@ def create_dir(
             elif warn_mode == WarnEnum.DEBUG:
                 logger.debug(_message)
 
-            os.makedirs(create_dir)
+            ## Directory created concurrently after the check isn't an error:
+            os.makedirs(create_dir, exist_ok=True)
         except OSError as err:
             if (err.errno == errno.EEXIST) and (warn_mode == WarnEnum.DEBUG):
                 logger.debug(f"'{create_dir}' directory already exists!")
@@ -315,7 +436,7 @@ def remove_dir(
             logger.debug(_message)
 
     elif warn_mode == WarnEnum.ERROR:
-        raise OSError(errno.ENOENT, f"'{create_dir}' directory doesn't exist!")
+        raise OSError(errno.ENOENT, f"'{remove_dir}' directory doesn't exist!")
 
     return
 
@@ -405,15 +526,17 @@ def get_file_checksum(
     file_path: constr(strip_whitespace=True, min_length=1, max_length=_path_max_length),  # type: ignore
     hash_method: HashAlgoEnum = HashAlgoEnum.md5,
     chunk_size: conint(ge=10) = 4096,  # type: ignore
+    use_pipeline: bool = False,
     warn_mode: WarnEnum = WarnEnum.DEBUG,
 ) -> str:
     """Get file checksum.
 
     Args:
-        file_path   (str         , required): Target file path.
-        hash_method (HashAlgoEnum, optional): Hash method. Defaults to `HashAlgoEnum.md5`.
-        chunk_size  (int         , optional): Chunk size. Defaults to 4096.
-        warn_mode   (str         , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
+        file_path    (str         , required): Target file path.
+        hash_method  (HashAlgoEnum, optional): Hash method. Defaults to `HashAlgoEnum.md5`.
+        chunk_size   (int         , optional): Chunk size. Defaults to 4096.
+        use_pipeline (bool        , optional): Overlap next chunk read with current chunk hashing. Defaults to False.
+        warn_mode    (str         , optional): Warning message mode, for example: 'ERROR', 'ALWAYS', 'DEBUG', 'IGNORE'. Defaults to 'DEBUG'.
 
     Raises:
         OSError: When warning mode is set to ERROR and file doesn't exist.
@@ -426,11 +549,16 @@ def get_file_checksum(
     if os.path.isfile(file_path):
         _file_hash = hashlib.new(hash_method.value)
         with open(file_path, "rb") as _file:
-            while True:
-                _file_chunk = _file.read(chunk_size)
-                if not _file_chunk:
-                    break
-                _file_hash.update(_file_chunk)
+            if use_pipeline:
+                _pipeline_update_hash(
+                    file_hash=_file_hash, file=_file, chunk_size=chunk_size
+                )
+            else:
+                while True:
+                    _file_chunk = _file.read(chunk_size)
+                    if not _file_chunk:
+                        break
+                    _file_hash.update(_file_chunk)
 
         _file_checksum = _file_hash.hexdigest()
     else:
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import os
 import uuid
 import string
 import secrets
 import hashlib
+from typing import List
 
 from pydantic import validate_call, conint, constr
 
@@ -26,6 +28,31 @@ def gen_unique_id(prefix: constr(strip_whitespace=True, max_length=32) = "") ->
     return _id
 
 
+@validate_call
+def gen_unique_ids(
+    count: conint(ge=0),  # type: ignore
+    prefix: constr(strip_whitespace=True, max_length=32) = "",  # type: ignore
+) -> List[str]:
+    """Generate list of unique ids, same format as `gen_unique_id()`.
+    Random bytes are read once for all ids and timestamp is taken once.
+
+    Args:
+        count  (int, required): Number of ids to generate.
+        prefix (str, optional): Prefix of ids. Defaults to ''.
+
+    Returns:
+        List[str]: List of unique ids.
+    """
+
+    _id_prefix = f"{prefix}{now_ts()}_".lower()
+    _random_bytes = os.urandom(16 * count)
+    _ids = [
+        _id_prefix + uuid.UUID(bytes=_random_bytes[_i : (_i + 16)], version=4).hex
+        for _i in range(0, 16 * count, 16)
+    ]
+    return _ids
+
+
 @validate_call
 def gen_random_string(length: conint(ge=1) = 16, is_alphanum: bool = True) -> str:  # type: ignore
     """Generate secure random string.
@@ -70,6 +97,7 @@ def hash_str(val: str, algorithm: HashAlgoEnum = HashAlgoEnum.sha256) -> str:
 
 __all__ = [
     "gen_unique_id",
+    "gen_unique_ids",
     "gen_random_string",
     "hash_str",
 ]
@@ -8,14 +8,12 @@ from ._create import *
 from ._close import *
 
 
-register_orms()
-
 ## Async
 async_write_engine = make_async_engine(dsn_url=config.db.dsn_url)
-AsyncWriteSession = create_async_session_maker(async_engine=async_write_engine)
+AsyncWriteSession = create_async_sessionmaker(async_engine=async_write_engine)
 
 async_read_engine = make_async_engine(dsn_url=config.db.read_dsn_url)
-AsyncReadSession = create_async_session_maker(async_engine=async_read_engine)
+AsyncReadSession = create_async_sessionmaker(async_engine=async_read_engine)
 
 ## Sync
 # write_engine = make_engine(dsn_url=config.db.dsn_url)
@@ -50,7 +48,10 @@ __all__ = [
     # "ReadSession",
     "engines",
     "sessions",
+    "orm_models",
+    "register_orms",
     "make_async_engine",
+    "create_async_sessionmaker",
     "create_async_session_maker",
     "async_create_db",
     "async_is_db_connectable",
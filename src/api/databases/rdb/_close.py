@@ -1,12 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from typing import List, Union
 
-from pydantic import validate_call
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import Engine
 from sqlalchemy.orm import scoped_session, close_all_sessions
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    async_sessionmaker,
     async_scoped_session,
     close_all_sessions as async_close_all_sessions,
 )
@@ -15,22 +17,26 @@ from api.logger import logger
 
 
 ## Async
-@validate_call(config={"arbitrary_types_allowed": True})
 async def async_close_db(
-    sessions: List[Union[scoped_session, async_scoped_session]],
+    sessions: List[Union[scoped_session, async_scoped_session, async_sessionmaker]],
     engines: List[Union[Engine, AsyncEngine]],
 ) -> None:
     """Close all database sessions (connections) and dispose all engines.
 
     Args:
-        sessions (List[Union[scoped_session, async_scoped_session]], required): List of SQLAlchemy sessions.
+        sessions (List[Union[scoped_session, async_scoped_session,
+                             async_sessionmaker]]              , required): List of SQLAlchemy session makers.
         engines  (List[Union[Engine, AsyncEngine]]                 , required): List of SQLAlchemy engines.
     """
 
     logger.info(f"Closing all database connections...")
     try:
-        close_all_sessions()
-        await async_close_all_sessions()
+        ## Plain `async_sessionmaker` sessions are closed per request, only scoped registries need closing:
+        if any(isinstance(_session, scoped_session) for _session in sessions):
+            close_all_sessions()
+
+        if any(isinstance(_session, async_scoped_session) for _session in sessions):
+            await async_close_all_sessions()
         # for _session in sessions:
         #     if isinstance(_session, scoped_session):
         #         # _session.remove()
@@ -39,11 +45,20 @@ async def async_close_db(
         #         # await _session.remove()
         #         await _session.close_all()
 
+        _async_engines: List[AsyncEngine] = []
+        _engines: List[Engine] = []
         for _engine in engines:
-            if isinstance(_engine, Engine):
-                _engine.dispose()
-            elif isinstance(_engine, AsyncEngine):
-                await _engine.dispose()
+            if isinstance(_engine, AsyncEngine):
+                _async_engines.append(_engine)
+            else:
+                _engines.append(_engine)
+
+        ## Dispose all engines concurrently (sync engines in a single threadpool call):
+        _disposes = [_async_engine.dispose() for _async_engine in _async_engines]
+        if _engines:
+            _disposes.append(run_in_threadpool(_dispose_engines, engines=_engines))
+
+        await asyncio.gather(*_disposes)
 
     except Exception:
         logger.exception("Failed to close database connections!")
@@ -54,7 +69,17 @@ async def async_close_db(
 
 
 ## Sync
-@validate_call(config={"arbitrary_types_allowed": True})
+def _dispose_engines(engines: List[Engine]) -> None:
+    """Dispose all sync engines one by one.
+
+    Args:
+        engines (List[Engine], required): List of SQLAlchemy engines.
+    """
+
+    for _engine in engines:
+        _engine.dispose()
+
+
 def close_db(sessions: List[scoped_session], engines: List[Engine]) -> None:
     """Close all database sessions (connections) and dispose all engines.
 
@@ -65,13 +90,13 @@ def close_db(sessions: List[scoped_session], engines: List[Engine]) -> None:
 
     logger.info(f"Closing all database connections...")
     try:
-        close_all_sessions()
+        if sessions:
+            close_all_sessions()
         # for _session in sessions:
         #     # _session.remove()
         #     _session.close_all()
 
-        for _engine in engines:
-            _engine.dispose()
+        _dispose_engines(engines=engines)
 
     except Exception:
         logger.exception("Failed to close database connections!")
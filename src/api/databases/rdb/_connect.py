@@ -2,7 +2,7 @@
 
 import asyncio
 
-from pydantic import validate_call, AnyUrl
+from pydantic import AnyUrl
 from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.ext.asyncio import (
@@ -12,68 +12,124 @@ from sqlalchemy.ext.asyncio import (
     async_scoped_session,
     AsyncSession,
 )
-from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, SingletonThreadPool
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    QueuePool,
+    SingletonThreadPool,
+    NullPool,
+)
 
 from api.config import config
 
 
+_ENGINE_DEFAULTS = {
+    "echo": config.db.echo_sql,
+    "echo_pool": config.db.echo_pool,
+    "pool_pre_ping": config.db.pool_pre_ping,
+    "pool_recycle": config.db.pool_recycle,
+    "query_cache_size": config.db.query_cache_size,
+}
+
+_connect_args = dict(config.db.connect_args or {})
+## Let psycopg prepare repeated statements (e.g. get by ID) on the server side:
+if config.db.driver == "psycopg":
+    _connect_args.setdefault("prepare_threshold", config.db.prepare_threshold)
+
+if _connect_args:
+    _ENGINE_DEFAULTS["connect_args"] = _connect_args
+
+## Short-lived (CLI, script, migration) engines open a connection per use and keep nothing:
+_SHORT_LIVED_DEFAULTS = {
+    **{
+        _key: _val
+        for _key, _val in _ENGINE_DEFAULTS.items()
+        if _key not in ("pool_pre_ping", "pool_recycle")
+    },
+    "poolclass": NullPool,
+}
+
+_QUEUE_POOL_DEFAULTS = {
+    "max_overflow": config.db.max_overflow,
+    "pool_timeout": config.db.pool_timeout,
+    "pool_size": config.db.pool_size,
+}
+_SINGLETON_POOL_DEFAULTS = {"pool_size": config.db.pool_size}
+
+## Pool class families by accepted sizing arguments:
+_POOL_WITH_OVERFLOW = (QueuePool, AsyncAdaptedQueuePool)
+_POOL_WITH_SIZE = (SingletonThreadPool,)
+
+
 ## Async
-@validate_call
-def make_async_engine(dsn_url: AnyUrl, **kwargs) -> AsyncEngine:
+def make_async_engine(
+    dsn_url: AnyUrl, short_lived: bool = False, **kwargs
+) -> AsyncEngine:
     """Create an async engine from a database connection string.
 
     Args:
-        dsn_url  (AnyUrl        , required): Database connection string as Data Source Name (URL).
-        **kwargs (Dict[str, Any], optional): Additional keyword arguments.
+        dsn_url     (AnyUrl        , required): Database connection string as Data Source Name (URL).
+        short_lived (bool          , optional): Use `NullPool` without pool pre-ping/recycle for one-shot engines. Defaults to False.
+        **kwargs    (Dict[str, Any], optional): Additional keyword arguments.
+
+    Raises:
+        ValueError: If sync `QueuePool` pool class is passed for async engine.
 
     Returns:
         AsyncEngine: SQLAlchemy async engine for database.
     """
 
-    if not kwargs:
-        kwargs = {}
-
-    if ("connect_args" not in kwargs) and config.db.connect_args:
-        kwargs["connect_args"] = config.db.connect_args
+    if short_lived:
+        kwargs = {**_SHORT_LIVED_DEFAULTS, **kwargs}
+    else:
+        kwargs = {**_ENGINE_DEFAULTS, "poolclass": AsyncAdaptedQueuePool, **kwargs}
 
-    if "echo" not in kwargs:
-        kwargs["echo"] = config.db.echo_sql
+    _poolclass = kwargs["poolclass"]
+    if issubclass(_poolclass, QueuePool) and (
+        not issubclass(_poolclass, AsyncAdaptedQueuePool)
+    ):
+        raise ValueError(
+            f"`{_poolclass.__name__}` pool class can't be used with async engine, use `AsyncAdaptedQueuePool` instead!"
+        )
 
-    if "echo_pool" not in kwargs:
-        kwargs["echo_pool"] = config.db.echo_pool
+    if issubclass(_poolclass, _POOL_WITH_OVERFLOW):
+        kwargs = {**_QUEUE_POOL_DEFAULTS, **kwargs}
+    elif issubclass(_poolclass, _POOL_WITH_SIZE):
+        kwargs = {**_SINGLETON_POOL_DEFAULTS, **kwargs}
 
-    if "pool_pre_ping" not in kwargs:
-        kwargs["pool_pre_ping"] = True
-
-    if "pool_recycle" not in kwargs:
-        kwargs["pool_recycle"] = config.db.pool_recycle
+    dsn_url = str(dsn_url)
+    _async_engine = create_async_engine(url=dsn_url, **kwargs)
+    return _async_engine
 
-    if "poolclass" not in kwargs:
-        kwargs["poolclass"] = AsyncAdaptedQueuePool
 
-    if issubclass(kwargs["poolclass"], AsyncAdaptedQueuePool):
-        if "max_overflow" not in kwargs:
-            kwargs["max_overflow"] = config.db.max_overflow
+def create_async_sessionmaker(
+    async_engine: AsyncEngine, **kwargs
+) -> async_sessionmaker[AsyncSession]:
+    """Create an async session maker from an async engine.
+    Sessions are scoped per request by dependencies with `async with`, so no scoped registry is needed.
 
-        if "pool_timeout" not in kwargs:
-            kwargs["pool_timeout"] = config.db.pool_timeout
+    Args:
+        async_engine (AsyncEngine   , required): SQLAlchemy async engine for session.
+        **kwargs     (Dict[str, Any], optional): Additional keyword arguments.
 
-    if (
-        issubclass(kwargs["poolclass"], AsyncAdaptedQueuePool)
-        or issubclass(kwargs["poolclass"], SingletonThreadPool)
-    ) and ("pool_size" not in kwargs):
-        kwargs["pool_size"] = config.db.pool_size
+    Returns:
+        async_sessionmaker[AsyncSession]: SQLAlchemy async session maker.
+    """
 
-    dsn_url = str(dsn_url)
-    _async_engine = create_async_engine(url=dsn_url, **kwargs)
-    return _async_engine
+    _async_session_maker = async_sessionmaker(
+        bind=async_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        **kwargs
+    )
+    return _async_session_maker
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
 def create_async_session_maker(
     async_engine: AsyncEngine, **kwargs
 ) -> async_scoped_session[AsyncSession]:
-    """Create an async session maker from an async engine.
+    """Create an async scoped (per asyncio task) session maker from an async engine.
+    Deprecated: use `create_async_sessionmaker()` instead.
 
     Args:
         async_engine (AsyncEngine   , required): SQLAlchemy async engine for session.
@@ -97,58 +153,34 @@ def create_async_session_maker(
 
 
 ## Sync
-@validate_call
-def make_engine(dsn_url: AnyUrl, **kwargs) -> Engine:
+def make_engine(dsn_url: AnyUrl, short_lived: bool = False, **kwargs) -> Engine:
     """Create an engine from a database connection string.
 
     Args:
-        dsn_url  (AnyUrl        , required): Database connection string as Data Source Name (URL).
-        **kwargs (Dict[str, Any], optional): Additional keyword arguments.
+        dsn_url     (AnyUrl        , required): Database connection string as Data Source Name (URL).
+        short_lived (bool          , optional): Use `NullPool` without pool pre-ping/recycle for one-shot engines. Defaults to False.
+        **kwargs    (Dict[str, Any], optional): Additional keyword arguments.
 
     Returns:
         Engine: SQLAlchemy engine for database.
     """
 
-    if not kwargs:
-        kwargs = {}
-
-    if ("connect_args" not in kwargs) and config.db.connect_args:
-        kwargs["connect_args"] = config.db.connect_args
-
-    if "echo" not in kwargs:
-        kwargs["echo"] = config.db.echo_sql
-
-    if "echo_pool" not in kwargs:
-        kwargs["echo_pool"] = config.db.echo_pool
-
-    if "pool_pre_ping" not in kwargs:
-        kwargs["pool_pre_ping"] = True
-
-    if "pool_recycle" not in kwargs:
-        kwargs["pool_recycle"] = config.db.pool_recycle
-
-    if "poolclass" not in kwargs:
-        kwargs["poolclass"] = QueuePool
-
-    if issubclass(kwargs["poolclass"], QueuePool):
-        if "max_overflow" not in kwargs:
-            kwargs["max_overflow"] = config.db.max_overflow
-
-        if "pool_timeout" not in kwargs:
-            kwargs["pool_timeout"] = config.db.pool_timeout
+    if short_lived:
+        kwargs = {**_SHORT_LIVED_DEFAULTS, **kwargs}
+    else:
+        kwargs = {**_ENGINE_DEFAULTS, "poolclass": QueuePool, **kwargs}
 
-    if (
-        issubclass(kwargs["poolclass"], QueuePool)
-        or issubclass(kwargs["poolclass"], SingletonThreadPool)
-    ) and ("pool_size" not in kwargs):
-        kwargs["pool_size"] = config.db.pool_size
+    _poolclass = kwargs["poolclass"]
+    if issubclass(_poolclass, _POOL_WITH_OVERFLOW):
+        kwargs = {**_QUEUE_POOL_DEFAULTS, **kwargs}
+    elif issubclass(_poolclass, _POOL_WITH_SIZE):
+        kwargs = {**_SINGLETON_POOL_DEFAULTS, **kwargs}
 
     dsn_url = str(dsn_url)
     _engine = create_engine(url=dsn_url, **kwargs)
     return _engine
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
 def create_session_maker(engine: Engine, **kwargs) -> scoped_session[Session]:
     """Create a session maker from an engine.
 
@@ -168,6 +200,7 @@ def create_session_maker(engine: Engine, **kwargs) -> scoped_session[Session]:
 
 __all__ = [
     "make_async_engine",
+    "create_async_sessionmaker",
     "create_async_session_maker",
     "make_engine",
     "create_session_maker",
@@ -1,26 +1,73 @@
 # -*- coding: utf-8 -*-
 
-from pydantic import validate_call
+from typing import Set, List, Type
+
 from fastapi.concurrency import run_in_threadpool
-from sqlalchemy import Engine, URL
+from sqlalchemy import Engine, URL, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy_utils import database_exists, create_database
 
 from api.core.constants import WarnEnum
 from api.core.models import BaseORM
+from api.resources.table_stat.model import TableStatORM
+from api.resources.task.model import TaskORM
 from api.logger import logger
 
 
-def register_orms() -> None:
-    # Add all your ORM models here...
-    from api.resources.table_stat.model import TableStatORM
-    from api.resources.task.model import TaskORM
+## Add all your ORM models here...
+orm_models: List[Type[BaseORM]] = [
+    TableStatORM,
+    TaskORM,
+]
+
+
+## Database URLs already known to exist in this process:
+_DB_EXISTS_CACHE: Set[str] = set()
 
-    return
+
+def register_orms() -> List[Type[BaseORM]]:
+    """Get registered ORM models.
+    All models are imported with this module, so `BaseORM.metadata` is already populated.
+
+    Returns:
+        List[Type[BaseORM]]: List of registered ORM model classes.
+    """
+
+    return orm_models
 
 
 ## Async
-@validate_call(config={"arbitrary_types_allowed": True})
+async def _async_probe_db_exists(async_engine: AsyncEngine) -> bool:
+    """Check database exists by probing it through the engine's own driver.
+    On PostgreSQL this avoids `database_exists()` opening a separate sync connection in a threadpool.
+
+    Args:
+        async_engine (AsyncEngine, required): SQLAlchemy async engine to check database.
+
+    Raises:
+        OperationalError: If can't connect to database server for any other reason.
+
+    Returns:
+        bool: True if the database exists, False otherwise.
+    """
+
+    _url: URL = async_engine.url
+    if _url.get_backend_name() != "postgresql":
+        return await run_in_threadpool(database_exists, url=_url)
+
+    try:
+        async with async_engine.connect() as _connection:
+            await _connection.execute(text("SELECT 1"))
+    except OperationalError as err:
+        ## `invalid_catalog_name` (database doesn't exist):
+        if getattr(err.orig, "sqlstate", None) == "3D000":
+            return False
+        raise
+
+    return True
+
+
 async def async_create_db(
     async_engine: AsyncEngine, warn_mode: WarnEnum = WarnEnum.ERROR
 ) -> bool:
@@ -37,16 +84,21 @@ async def async_create_db(
         bool: True if the database exists, False otherwise.
     """
 
+    _url: URL = async_engine.url
+    _cache_key = str(_url)
+    if _cache_key in _DB_EXISTS_CACHE:
+        return True
+
     _is_db_exists = False
     try:
-        _url: URL = async_engine.url
-        if not await run_in_threadpool(database_exists, url=_url):
+        if not await _async_probe_db_exists(async_engine=async_engine):
             logger.warning(
                 f"Can't connect to '{_url.database}' database or doesn't exist, trying to create it..."
             )
             await run_in_threadpool(create_database, url=_url)
             logger.success(f"Successfully created '{_url.database}' database.")
 
+        _DB_EXISTS_CACHE.add(_cache_key)
         _is_db_exists = True
     except Exception:
         _message = f"Failed to create '{_url.database}' database!"
@@ -60,7 +112,6 @@ async def async_create_db(
     return _is_db_exists
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
 async def async_create_structure(async_engine: AsyncEngine) -> None:
     """Initialize and create database structure.
 
@@ -72,7 +123,6 @@ async def async_create_structure(async_engine: AsyncEngine) -> None:
     logger.info(f"Initializing '{_db_name}' database structure...")
     try:
         async with async_engine.begin() as _connection:
-            register_orms()
             await _connection.run_sync(BaseORM.metadata.create_all)
 
     except Exception:
@@ -86,7 +136,35 @@ async def async_create_structure(async_engine: AsyncEngine) -> None:
 
 
 ## Sync
-@validate_call(config={"arbitrary_types_allowed": True})
+def _probe_db_exists(engine: Engine) -> bool:
+    """Check database exists by probing it through the engine's own driver.
+
+    Args:
+        engine (Engine, required): SQLAlchemy engine to check database.
+
+    Raises:
+        OperationalError: If can't connect to database server for any other reason.
+
+    Returns:
+        bool: True if the database exists, False otherwise.
+    """
+
+    _url: URL = engine.url
+    if _url.get_backend_name() != "postgresql":
+        return database_exists(url=_url)
+
+    try:
+        with engine.connect() as _connection:
+            _connection.execute(text("SELECT 1"))
+    except OperationalError as err:
+        ## `invalid_catalog_name` (database doesn't exist):
+        if getattr(err.orig, "sqlstate", None) == "3D000":
+            return False
+        raise
+
+    return True
+
+
 def create_db(engine: Engine, warn_mode: WarnEnum = WarnEnum.ERROR) -> bool:
     """Create database if it doesn't exist.
 
@@ -101,16 +179,21 @@ def create_db(engine: Engine, warn_mode: WarnEnum = WarnEnum.ERROR) -> bool:
         bool: True if the database exists, False otherwise.
     """
 
+    _url: URL = engine.url
+    _cache_key = str(_url)
+    if _cache_key in _DB_EXISTS_CACHE:
+        return True
+
     _is_db_exists = False
     try:
-        _url: URL = engine.url
-        if not database_exists(url=_url):
+        if not _probe_db_exists(engine=engine):
             logger.warning(
                 f"Can't connect to '{_url.database}' database or doesn't exist, trying to create it..."
             )
             create_database(url=_url)
             logger.success(f"Successfully created '{_url.database}' database.")
 
+        _DB_EXISTS_CACHE.add(_cache_key)
         _is_db_exists = True
     except Exception:
         _message = f"Failed to create '{_url.database}' database!"
@@ -124,7 +207,6 @@ def create_db(engine: Engine, warn_mode: WarnEnum = WarnEnum.ERROR) -> bool:
     return _is_db_exists
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
 def create_structure(engine: Engine) -> None:
     """Initialize and create database structure.
 
@@ -136,7 +218,6 @@ def create_structure(engine: Engine) -> None:
     logger.info(f"Initializing '{_db_name}' database structure...")
     try:
         with engine.begin() as _connection:
-            register_orms()
             BaseORM.metadata.create_all(bind=_connection)
 
     except Exception:
@@ -150,6 +231,7 @@ def create_structure(engine: Engine) -> None:
 
 
 __all__ = [
+    "orm_models",
     "register_orms",
     "async_create_db",
     "async_create_structure",
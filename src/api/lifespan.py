@@ -19,7 +19,7 @@ from .databases.rdb import (
     engines,
     sessions,
 )
-from .logger import logger
+from .logger import logger, async_start_log_worker, async_stop_log_worker
 
 
 def pre_check() -> None:
@@ -76,6 +76,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
 
     logger.info("Preparing to startup...")
+    await async_start_log_worker()
     # await _async_create_dirs()
     if config.api.security.asymmetric.generate:
         await asymmetric_helper.async_create_keys(
@@ -102,6 +103,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Praparing to shutdown...")
     ## Add shutdown code here...
     await async_close_db(sessions=sessions, engines=engines)
+    await async_stop_log_worker()
     logger.success("Finished preparation to shutdown.")
 
 
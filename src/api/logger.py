@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+from typing import List, Tuple, Union
+
 from pydantic import validate_call
 from fastapi.concurrency import run_in_threadpool
 
@@ -116,9 +119,123 @@ async def async_log_mode(
     return
 
 
+## Queued (message, args, level, warn_mode) logs, written by background worker in batches:
+_LOG_QUEUE_MAX_SIZE = 10000
+_LOG_BATCH_SIZE = 100
+_log_queue: Union[asyncio.Queue, None] = None
+_log_worker_task: Union[asyncio.Task, None] = None
+
+
+def _log_batch(batch: List[Tuple[str, tuple, str, WarnEnum]]) -> None:
+    """Format and write batch of queued log messages.
+
+    Args:
+        batch (List[Tuple[str, tuple, str, WarnEnum]], required): List of (message, args, level, warn_mode).
+    """
+
+    for _message, _args, _level, _warn_mode in batch:
+        if _args:
+            _message = _message.format(*_args)
+
+        log_mode(message=_message, level=_level, warn_mode=_warn_mode)
+
+    return
+
+
+async def _async_log_worker(log_queue: asyncio.Queue) -> None:
+    """Background worker to write queued log messages in batches (one thread hop per batch).
+
+    Args:
+        log_queue (asyncio.Queue, required): Queue of (message, args, level, warn_mode).
+    """
+
+    while True:
+        _batch = [await log_queue.get()]
+        while (len(_batch) < _LOG_BATCH_SIZE) and (not log_queue.empty()):
+            _batch.append(log_queue.get_nowait())
+
+        try:
+            await run_in_threadpool(_log_batch, _batch)
+        except Exception:
+            logger.exception("Failed to write queued log messages!")
+
+
+def log_mode_nowait(
+    message: str,
+    *args,
+    level: str = "INFO",
+    warn_mode: WarnEnum = WarnEnum.ALWAYS,
+) -> None:
+    """Put log message into queue without waiting, background worker formats and writes it.
+    Logs directly if worker is not started or queue is full.
+
+    Args:
+        message   (str     , required): Message to log, with `{}` placeholders for `args`.
+        *args     (Any     , optional): Message format arguments, only formatted if message is logged.
+        level     (str     , optional): Log level when warn mode is `WarnEnum.ALWAYS`. Defaults to "INFO".
+        warn_mode (WarnEnum, optional): Warn mode to use. Defaults to `WarnEnum.ALWAYS`.
+    """
+
+    if warn_mode == WarnEnum.IGNORE:
+        return
+
+    if _log_queue is not None:
+        try:
+            _log_queue.put_nowait((message, args, level, warn_mode))
+            return
+        except asyncio.QueueFull:
+            pass
+
+    _log_batch(batch=[(message, args, level, warn_mode)])
+    return
+
+
+async def async_start_log_worker() -> None:
+    """Start background worker for `log_mode_nowait()` queued log messages."""
+
+    global _log_queue, _log_worker_task
+
+    if _log_worker_task is not None:
+        return
+
+    _log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_MAX_SIZE)
+    _log_worker_task = asyncio.create_task(_async_log_worker(log_queue=_log_queue))
+    return
+
+
+async def async_stop_log_worker() -> None:
+    """Stop background log worker and write remaining queued log messages."""
+
+    global _log_queue, _log_worker_task
+
+    if _log_worker_task is None:
+        return
+
+    _log_queue, _queue = None, _log_queue
+    _log_worker_task.cancel()
+    try:
+        await _log_worker_task
+    except asyncio.CancelledError:
+        pass
+
+    _log_worker_task = None
+
+    _batch = []
+    while not _queue.empty():
+        _batch.append(_queue.get_nowait())
+
+    if _batch:
+        _log_batch(batch=_batch)
+
+    return
+
+
 __all__ = [
     "logger_loader",
     "logger",
     "log_mode",
     "async_log_mode",
+    "log_mode_nowait",
+    "async_start_log_worker",
+    "async_stop_log_worker",
 ]
@@ -1,18 +1,32 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union
+import time
+from typing import Union, Dict, Tuple
 
-from pydantic import validate_call
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.constants import WarnEnum
+from api.config import config
 from api.resources.table_stat.model import TableStatORM
-from api.logger import async_log_mode
+from api.logger import log_mode_nowait
 
 from .model import TableStatORM
 
 
-@validate_call(config={"arbitrary_types_allowed": True})
+## Cached row counts by table name: (expire monotonic time, row count)
+_ROW_COUNT_CACHE: Dict[str, Tuple[float, int]] = {}
+
+
+def invalidate_row_count(table_name: str) -> None:
+    """Drop cached row count of the table, e.g. after inserting or deleting rows.
+
+    Args:
+        table_name (str, required): Name of the table.
+    """
+
+    _ROW_COUNT_CACHE.pop(table_name, None)
+
+
 async def async_get_row_count(
     async_session: AsyncSession,
     request_id: str,
@@ -31,8 +45,14 @@ async def async_get_row_count(
         int: Count of rows.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Getting row count of '{table_name}' table from table stat...",
+    _cached = _ROW_COUNT_CACHE.get(table_name)
+    if _cached and (time.monotonic() < _cached[0]):
+        return _cached[1]
+
+    log_mode_nowait(
+        "[{}] - Getting row count of '{}' table from table stat...",
+        request_id,
+        table_name,
         warn_mode=warn_mode,
     )
 
@@ -44,8 +64,17 @@ async def async_get_row_count(
     if _table_stat_orm:
         _row_scount = _table_stat_orm.row_count
 
-    await async_log_mode(
-        message=f"[{request_id}] - Successfully got row count of '{table_name}' table: {_row_scount}.",
+    if 0 < config.db.row_count_cache_ttl:
+        _ROW_COUNT_CACHE[table_name] = (
+            time.monotonic() + config.db.row_count_cache_ttl,
+            _row_scount,
+        )
+
+    log_mode_nowait(
+        "[{}] - Successfully got row count of '{}' table: {}.",
+        request_id,
+        table_name,
+        _row_scount,
         level="SUCCESS",
         warn_mode=warn_mode,
     )
@@ -53,5 +82,6 @@ async def async_get_row_count(
 
 
 __all__ = [
+    "invalidate_row_count",
     "async_get_row_count",
 ]
@@ -70,34 +70,29 @@ async def get_tasks(
             async_session=db_session,
             request_id=_request_id,
             offset=skip,
-            limit=(limit + 1),
+            limit=limit,
             is_desc=is_desc,
         )
         _orm_tasks, _all_count = _result_tuple
 
+        ## Build relative base URL once, then only format `skip` for each link:
         _url = request.url.remove_query_params(["skip", "limit"])
+        _base_url = utils.get_relative_url(_url)
+        _base_url = f"{_base_url}&" if _url.query else f"{_base_url}?"
+        _link_template = _base_url + "skip={}&limit=" + str(limit)
 
         if 0 < _all_count:
-            _links["first"] = utils.get_relative_url(
-                _url.include_query_params(skip=0, limit=limit)
-            )
+            _links["first"] = _link_template.format(0)
 
             _last_skip = max((_all_count - 1) // limit * limit, 0)
-            _links["last"] = utils.get_relative_url(
-                _url.include_query_params(skip=_last_skip, limit=limit)
-            )
+            _links["last"] = _link_template.format(_last_skip)
 
         if 0 < skip:
             _prev_skip = max(skip - limit, 0)
-            _links["prev"] = utils.get_relative_url(
-                _url.include_query_params(skip=_prev_skip, limit=limit)
-            )
-
-        if limit < len(_orm_tasks):
-            _orm_tasks = _orm_tasks[:limit]
-            _links["next"] = utils.get_relative_url(
-                _url.include_query_params(skip=(skip + limit), limit=limit)
-            )
+            _links["prev"] = _link_template.format(_prev_skip)
+
+        if (skip + limit) < _all_count:
+            _links["next"] = _link_template.format(skip + limit)
 
         _list_count = len(_orm_tasks)
         if 0 < _list_count:
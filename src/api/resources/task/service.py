@@ -6,11 +6,15 @@ from pydantic import validate_call
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.core.constants import ErrorCodeEnum, WarnEnum
+from api.core.constants import WarnEnum
 from api.config import config
-from api.core.exceptions import BaseHTTPException, EmptyValueError, NullConstraintError
+from api.core.exceptions import (
+    EmptyValueError,
+    NullConstraintError,
+    translate_db_errors,
+)
 from api.resources.table_stat import service as table_stat_service
-from api.logger import async_log_mode
+from api.logger import log_mode_nowait
 
 from .schemas import TaskBasePM
 from .model import TaskORM
@@ -41,29 +45,31 @@ async def async_get_list(
         Tuple[List[TaskORM], int]: List of tasks and total count as tuple.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Getting task list...", warn_mode=warn_mode
-    )
+    log_mode_nowait("[{}] - Getting task list...", request_id, warn_mode=warn_mode)
 
     _where = []
     if kwargs:
         for _key, _val in kwargs.items():
             _where.append({"column": _key, "value": _val})
 
-    _orm_tasks: List[TaskORM] = await TaskORM.async_select_by_where(
-        async_session=async_session,
-        where=_where,
-        offset=offset,
-        limit=limit,
-        is_desc=is_desc,
-    )
-
+    _orm_tasks: List[TaskORM] = []
     _all_count = 0
     if _where:
-        _all_count = await TaskORM.async_count_by_where(
-            async_session=async_session, where=_where
+        ## Filtered page and its total count in a single query:
+        _orm_tasks, _all_count = await TaskORM.async_select_count_by_where(
+            async_session=async_session,
+            where=_where,
+            offset=offset,
+            limit=limit,
+            is_desc=is_desc,
         )
     else:
+        _orm_tasks: List[TaskORM] = await TaskORM.async_select(
+            async_session=async_session,
+            offset=offset,
+            limit=limit,
+            is_desc=is_desc,
+        )
         _all_count = await table_stat_service.async_get_row_count(
             async_session=async_session,
             request_id=request_id,
@@ -71,8 +77,9 @@ async def async_get_list(
             warn_mode=WarnEnum.DEBUG,
         )
 
-    await async_log_mode(
-        message=f"[{request_id}] - Successfully retrieved task list.",
+    log_mode_nowait(
+        "[{}] - Successfully retrieved task list.",
+        request_id,
         level="SUCCESS",
         warn_mode=warn_mode,
     )
@@ -80,6 +87,7 @@ async def async_get_list(
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
+@translate_db_errors("task", NullConstraintError)
 async def async_create(
     async_session: AsyncSession,
     request_id: str,
@@ -103,34 +111,29 @@ async def async_create(
         TaskORM: New TaskORM model.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Creating task...", warn_mode=warn_mode
-    )
-
-    _task_orm: TaskORM
-    try:
-        _task_orm: TaskORM = await TaskORM.async_insert(
-            async_session=async_session,
-            auto_commit=auto_commit,
-            **task_in.model_dump(),
-        )
+    log_mode_nowait("[{}] - Creating task...", request_id, warn_mode=warn_mode)
 
-        await async_log_mode(
-            message=f"[{request_id}] - Successfully created task with '{_task_orm.id}' ID.",
-            level="SUCCESS",
-            warn_mode=warn_mode,
-        )
-    except NullConstraintError as err:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.UNPROCESSABLE_ENTITY,
-            message="Task data is missing!",
-            description=f"Task: {err}",
-        )
+    _task_orm: TaskORM = await TaskORM.async_insert(
+        async_session=async_session,
+        returning=True,
+        auto_commit=auto_commit,
+        ## Flat scalar fields, so a shallow field dict skips `model_dump()` serialization:
+        data=dict(task_in),
+    )
+    table_stat_service.invalidate_row_count(table_name=TaskORM.__tablename__)
 
+    log_mode_nowait(
+        "[{}] - Successfully created task with '{}' ID.",
+        request_id,
+        _task_orm.id,
+        level="SUCCESS",
+        warn_mode=warn_mode,
+    )
     return _task_orm
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
+@translate_db_errors("task", NoResultFound)
 async def async_get(
     async_session: AsyncSession,
     request_id: str,
@@ -152,30 +155,30 @@ async def async_get(
         TaskORM: TaskORM model.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Getting task with '{id}' ID...",
-        warn_mode=warn_mode,
+    log_mode_nowait(
+        "[{}] - Getting task with '{}' ID...", request_id, id, warn_mode=warn_mode
     )
 
-    _task_orm: TaskORM
-    try:
-        _task_orm: TaskORM = await TaskORM.async_get(async_session=async_session, id=id)
-
-        await async_log_mode(
-            message=f"[{request_id}] - Successfully retrieved task with '{id}' ID.",
-            level="SUCCESS",
-            warn_mode=warn_mode,
-        )
-    except NoResultFound:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.NOT_FOUND,
-            message=f"Not found task with '{id}' ID!",
-        )
+    _task_orm: TaskORM = await TaskORM.async_get(async_session=async_session, id=id)
 
+    log_mode_nowait(
+        "[{}] - Successfully retrieved task with '{}' ID.",
+        request_id,
+        id,
+        level="SUCCESS",
+        warn_mode=warn_mode,
+    )
     return _task_orm
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
+@translate_db_errors(
+    "task",
+    EmptyValueError,
+    NoResultFound,
+    NullConstraintError,
+    messages={EmptyValueError: "No {resource} data provided to update!"},
+)
 async def async_update(
     async_session: AsyncSession,
     request_id: str,
@@ -204,43 +207,26 @@ async def async_update(
         TaskORM: Updated TaskORM object.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Updating task with '{id}' ID...",
-        warn_mode=warn_mode,
+    log_mode_nowait(
+        "[{}] - Updating task with '{}' ID...", request_id, id, warn_mode=warn_mode
     )
 
-    _task_orm: TaskORM
-    try:
-        _task_orm: TaskORM = await TaskORM.async_update_by_id(
-            async_session=async_session, id=id, auto_commit=auto_commit, **kwargs
-        )
-
-        await async_log_mode(
-            message=f"[{request_id}] - Successfully updated task with '{id}' ID.",
-            level="SUCCESS",
-            warn_mode=warn_mode,
-        )
-    except EmptyValueError:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.UNPROCESSABLE_ENTITY,
-            message="No task data provided to update!",
-        )
-    except NoResultFound:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.NOT_FOUND,
-            message=f"Not found task with '{id}' ID!",
-        )
-    except NullConstraintError as err:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.UNPROCESSABLE_ENTITY,
-            message="Task data is missing!",
-            description=f"Task: {err}",
-        )
+    _task_orm: TaskORM = await TaskORM.async_update_by_id(
+        async_session=async_session, id=id, auto_commit=auto_commit, **kwargs
+    )
 
+    log_mode_nowait(
+        "[{}] - Successfully updated task with '{}' ID.",
+        request_id,
+        id,
+        level="SUCCESS",
+        warn_mode=warn_mode,
+    )
     return _task_orm
 
 
 @validate_call(config={"arbitrary_types_allowed": True})
+@translate_db_errors("task", NoResultFound)
 async def async_delete(
     async_session: AsyncSession,
     request_id: str,
@@ -261,27 +247,22 @@ async def async_delete(
         BaseHTTPException: If task is not found.
     """
 
-    await async_log_mode(
-        message=f"[{request_id}] - Deleting task with '{id}' ID...",
-        warn_mode=warn_mode,
+    log_mode_nowait(
+        "[{}] - Deleting task with '{}' ID...", request_id, id, warn_mode=warn_mode
     )
 
-    try:
-        await TaskORM.async_delete_by_id(
-            async_session=async_session, id=id, auto_commit=auto_commit
-        )
-
-        await async_log_mode(
-            message=f"[{request_id}] - Successfully deleted task with '{id}' ID.",
-            level="SUCCESS",
-            warn_mode=warn_mode,
-        )
-    except NoResultFound:
-        raise BaseHTTPException(
-            error_enum=ErrorCodeEnum.NOT_FOUND,
-            message=f"Not found task with '{id}' ID!",
-        )
+    await TaskORM.async_delete_by_id(
+        async_session=async_session, id=id, auto_commit=auto_commit
+    )
+    table_stat_service.invalidate_row_count(table_name=TaskORM.__tablename__)
 
+    log_mode_nowait(
+        "[{}] - Successfully deleted task with '{}' ID.",
+        request_id,
+        id,
+        level="SUCCESS",
+        warn_mode=warn_mode,
+    )
     return
 
 
@@ -6,7 +6,6 @@ from typing import Union
 
 ## Third-party libraries
 import uvicorn
-from pydantic import validate_call
 from fastapi import FastAPI
 
 ## Internal modules
@@ -35,14 +34,19 @@ add_mounts(app=app)
 add_exception_handlers(app=app)
 
 
-@validate_call
 def run_server(app: str = "main:app") -> None:
     """Run uvicorn server.
 
     Args:
         app (str, optional): Application instance. Defaults to "main:app".
+
+    Raises:
+        TypeError: If `app` is not a string.
     """
 
+    if not isinstance(app, str):
+        raise TypeError(f"`app` must be a string, got `{type(app).__name__}`!")
+
     _ssl_keyfile: Union[str, None] = None
     _ssl_certfile: Union[str, None] = None
 
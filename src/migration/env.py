@@ -3,7 +3,7 @@
 from logging.config import fileConfig
 
 # from sqlalchemy import engine_from_config
-from sqlalchemy import pool
+# from sqlalchemy import pool
 from alembic import context
 
 from api.config import config as api_config
@@ -76,7 +76,7 @@ def run_migrations_online() -> None:
     #     poolclass=pool.NullPool,
     # )
 
-    _engine = make_engine(dsn_url=api_config.db.dsn_url, poolclass=pool.NullPool)
+    _engine = make_engine(dsn_url=api_config.db.dsn_url, short_lived=True)
     check_db(engine=_engine)
     with _engine.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
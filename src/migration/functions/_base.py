@@ -5,22 +5,19 @@ from alembic import op
 
 
 def create_fn_generate_pk() -> None:
-    """Create function to generate primary key for table."""
+    """Create function to generate primary key for table.
+    The application already generates IDs, so the trigger only calls it for rows without ID.
+    """
 
     op.execute(
         """
         CREATE OR REPLACE FUNCTION fn_tr__generate_pk()
         RETURNS TRIGGER AS $BODY$
-        DECLARE
-            v_prefix VARCHAR(3);
-            v_current_ts VARCHAR;
-            v_gen_uuid VARCHAR;
         BEGIN
             IF NEW."id" IS NULL THEN
-                v_prefix := LOWER(SUBSTRING(TG_TABLE_NAME FROM 5 FOR 3));
-                v_current_ts := EXTRACT(EPOCH FROM CURRENT_TIMESTAMP)::BIGINT::VARCHAR;
-                v_gen_uuid := REPLACE(gen_random_uuid()::VARCHAR, '-', '');
-                NEW."id" := v_prefix || v_current_ts || '_' || v_gen_uuid;
+                NEW."id" := LOWER(SUBSTRING(TG_TABLE_NAME FROM 5 FOR 3))
+                    || EXTRACT(EPOCH FROM CURRENT_TIMESTAMP)::BIGINT::VARCHAR
+                    || '_' || REPLACE(gen_random_uuid()::VARCHAR, '-', '');
             END IF;
 
             RETURN NEW;
@@ -100,6 +97,59 @@ def create_fn_stat_count(table_name: str) -> None:
     return
 
 
+@validate_call
+def create_fn_stat_count_per_statement(table_name: str) -> None:
+    """Create function to update stat count for stat table once per statement.
+    It counts affected rows from transition tables (`new_rows` for insert, `old_rows` for delete),
+    so it can only be used by statement level triggers with `REFERENCING` clause.
+
+    Args:
+        table_name (str, required): Name of the stat table.
+    """
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION fn_tr__stat_count_per_statement()
+        RETURNS TRIGGER AS $BODY$
+        DECLARE
+            v_count BIGINT;
+        BEGIN
+            IF (TG_OP = 'INSERT') THEN
+                SELECT COUNT(*) INTO v_count FROM new_rows;
+                IF (v_count > 0) THEN
+                    INSERT INTO "{table_name}" ("table_name", "insert_count", "row_count")
+                    VALUES (TG_TABLE_NAME, v_count, v_count)
+                    ON CONFLICT ("table_name") DO UPDATE
+                    SET "insert_count" = "{table_name}"."insert_count" + EXCLUDED."insert_count",
+                        "row_count" = "{table_name}"."row_count" + EXCLUDED."row_count";
+                END IF;
+            ELSIF (TG_OP = 'DELETE') THEN
+                SELECT COUNT(*) INTO v_count FROM old_rows;
+                IF (v_count > 0) THEN
+                    UPDATE "{table_name}"
+                    SET "delete_count" = "delete_count" + v_count,
+                        "row_count" = "row_count" - v_count
+                    WHERE "table_name" = TG_TABLE_NAME;
+                END IF;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $BODY$ LANGUAGE plpgsql;
+        """
+    )
+
+    return
+
+
+def drop_fn_stat_count_per_statement() -> None:
+    """Drop function to update stat count once per statement."""
+
+    op.execute("DROP FUNCTION IF EXISTS fn_tr__stat_count_per_statement() CASCADE;")
+
+    return
+
+
 def drop_fn_all() -> None:
     """Drop function to generate primary key for table."""
 
@@ -115,5 +165,7 @@ __all__ = [
     "create_fn_generate_pk",
     "create_fn_updated_at",
     "create_fn_stat_count",
+    "create_fn_stat_count_per_statement",
+    "drop_fn_stat_count_per_statement",
     "drop_fn_all",
 ]
@@ -7,26 +7,59 @@ from alembic import op
 
 
 @validate_call
-def create_tr_generate_pk(table_names: Union[List[str], str]) -> None:
+def create_tr_generate_pk(
+    table_names: Union[List[str], str], only_missing_id: bool = False
+) -> None:
     """Create trigger to generate primary key for table(s).
 
     Args:
-        table_names (Union[List[str], str], required): List of table names or a table name.
+        table_names     (Union[List[str], str], required): List of table names or a table name.
+        only_missing_id (bool                 , optional): Call function only for rows without ID (`WHEN` condition). Defaults to False.
     """
 
     if isinstance(table_names, str):
         table_names = [table_names]
 
+    _when = 'WHEN (NEW."id" IS NULL)' if only_missing_id else ""
+    _sqls: List[str] = []
     for _table_name in table_names:
-        op.execute(
+        _sqls.append(
             f"""
             CREATE OR REPLACE TRIGGER tr__generate_pk__{_table_name}
             BEFORE INSERT ON "{_table_name}"
             FOR EACH ROW
+            {_when}
             EXECUTE FUNCTION fn_tr__generate_pk();
             """
         )
 
+    ## Create all triggers in one round trip:
+    if _sqls:
+        op.execute("".join(_sqls))
+
+    return
+
+
+@validate_call
+def drop_tr_generate_pk(table_names: Union[List[str], str]) -> None:
+    """Drop trigger to generate primary key for table(s).
+
+    Args:
+        table_names (Union[List[str], str], required): List of table names or a table name.
+    """
+
+    if isinstance(table_names, str):
+        table_names = [table_names]
+
+    _sqls: List[str] = []
+    for _table_name in table_names:
+        _sqls.append(
+            f'DROP TRIGGER IF EXISTS tr__generate_pk__{_table_name} ON "{_table_name}";'
+        )
+
+    if _sqls:
+        op.execute("".join(_sqls))
+
     return
 
 
@@ -41,16 +74,21 @@ def create_tr_updated_at(table_names: Union[List[str], str]) -> None:
     if isinstance(table_names, str):
         table_names = [table_names]
 
+    _sqls: List[str] = []
     for _table_name in table_names:
-        op.execute(
+        _sqls.append(
             f"""
-                CREATE OR REPLACE TRIGGER tr__updated_at__{_table_name}
-                BEFORE UPDATE ON "{_table_name}"
-                FOR EACH ROW
-                EXECUTE PROCEDURE fn_tr__updated_at();
-                """
+            CREATE OR REPLACE TRIGGER tr__updated_at__{_table_name}
+            BEFORE UPDATE ON "{_table_name}"
+            FOR EACH ROW
+            EXECUTE PROCEDURE fn_tr__updated_at();
+            """
         )
 
+    ## Create all triggers in one round trip:
+    if _sqls:
+        op.execute("".join(_sqls))
+
     return
 
 
@@ -65,8 +103,9 @@ def create_tr_stat_count(table_names: Union[List[str], str]) -> None:
     if isinstance(table_names, str):
         table_names = [table_names]
 
+    _sqls: List[str] = []
     for _table_name in table_names:
-        op.execute(
+        _sqls.append(
             f"""
             CREATE OR REPLACE TRIGGER tr__update_stat_count__{_table_name}
             AFTER INSERT OR DELETE ON "{_table_name}"
@@ -75,7 +114,7 @@ def create_tr_stat_count(table_names: Union[List[str], str]) -> None:
             """
         )
 
-        op.execute(
+        _sqls.append(
             f"""
             CREATE OR REPLACE TRIGGER tr__truncate_stat_count__{_table_name}
             AFTER TRUNCATE ON "{_table_name}"
@@ -84,11 +123,111 @@ def create_tr_stat_count(table_names: Union[List[str], str]) -> None:
             """
         )
 
+    ## Create all triggers in one round trip:
+    if _sqls:
+        op.execute("".join(_sqls))
+
+    return
+
+
+@validate_call
+def drop_tr_stat_count(table_names: Union[List[str], str]) -> None:
+    """Drop per row insert/delete trigger to update stat count table for table(s).
+    Truncate trigger is kept, it's already per statement.
+
+    Args:
+        table_names (Union[List[str], str], required): List of table names or a table name.
+    """
+
+    if isinstance(table_names, str):
+        table_names = [table_names]
+
+    _sqls: List[str] = []
+    for _table_name in table_names:
+        _sqls.append(
+            f'DROP TRIGGER IF EXISTS tr__update_stat_count__{_table_name} ON "{_table_name}";'
+        )
+
+    if _sqls:
+        op.execute("".join(_sqls))
+
+    return
+
+
+@validate_call
+def create_tr_stat_count_per_statement(table_names: Union[List[str], str]) -> None:
+    """Create per statement insert/delete triggers to update stat count table for table(s).
+    A trigger with transition tables can't have more than one event, so insert and delete
+    have separate triggers.
+
+    Args:
+        table_names (Union[List[str], str], required): List of table names or a table name.
+    """
+
+    if isinstance(table_names, str):
+        table_names = [table_names]
+
+    _sqls: List[str] = []
+    for _table_name in table_names:
+        _sqls.append(
+            f"""
+            CREATE OR REPLACE TRIGGER tr__insert_stat_count__{_table_name}
+            AFTER INSERT ON "{_table_name}"
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION fn_tr__stat_count_per_statement();
+            """
+        )
+
+        _sqls.append(
+            f"""
+            CREATE OR REPLACE TRIGGER tr__delete_stat_count__{_table_name}
+            AFTER DELETE ON "{_table_name}"
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION fn_tr__stat_count_per_statement();
+            """
+        )
+
+    ## Create all triggers in one round trip:
+    if _sqls:
+        op.execute("".join(_sqls))
+
+    return
+
+
+@validate_call
+def drop_tr_stat_count_per_statement(table_names: Union[List[str], str]) -> None:
+    """Drop per statement insert/delete triggers to update stat count table for table(s).
+
+    Args:
+        table_names (Union[List[str], str], required): List of table names or a table name.
+    """
+
+    if isinstance(table_names, str):
+        table_names = [table_names]
+
+    _sqls: List[str] = []
+    for _table_name in table_names:
+        _sqls.append(
+            f'DROP TRIGGER IF EXISTS tr__insert_stat_count__{_table_name} ON "{_table_name}";'
+        )
+        _sqls.append(
+            f'DROP TRIGGER IF EXISTS tr__delete_stat_count__{_table_name} ON "{_table_name}";'
+        )
+
+    if _sqls:
+        op.execute("".join(_sqls))
+
     return
 
 
 __all__ = [
     "create_tr_generate_pk",
+    "drop_tr_generate_pk",
     "create_tr_updated_at",
     "create_tr_stat_count",
+    "drop_tr_stat_count",
+    "create_tr_stat_count_per_statement",
+    "drop_tr_stat_count_per_statement",
 ]
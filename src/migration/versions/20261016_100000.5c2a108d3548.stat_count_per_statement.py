@@ -0,0 +1,74 @@
+"""Update table stat counts once per statement.
+
+Revision ID: 5c2a108d3548
+Revises: aaf11408f3f8
+Create Date: 2026-10-16 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import context
+
+from migration import functions
+from migration import triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2a108d3548"
+down_revision: Union[str, None] = "aaf11408f3f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_STAT_TABLE_NAME = "fot_table_stat"
+_ALL_TABLE_NAMES = ["fot_task", "fot_table_stat"]
+
+
+def upgrade() -> None:
+    schema_upgrades()
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_upgrades()
+
+    return
+
+
+def downgrade() -> None:
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_downgrades()
+    schema_downgrades()
+
+    return
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+
+    ## Replace per row insert/delete triggers with per statement triggers:
+    triggers.drop_tr_stat_count(table_names=_ALL_TABLE_NAMES)
+    functions.create_fn_stat_count_per_statement(table_name=_STAT_TABLE_NAME)
+    triggers.create_tr_stat_count_per_statement(table_names=_ALL_TABLE_NAMES)
+
+    return
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+
+    triggers.drop_tr_stat_count_per_statement(table_names=_ALL_TABLE_NAMES)
+    functions.drop_fn_stat_count_per_statement()
+    triggers.create_tr_stat_count(table_names=_ALL_TABLE_NAMES)
+
+    return
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+    return
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
+
+    return
@@ -0,0 +1,72 @@
+"""Call generate PK trigger only for rows without ID.
+
+Revision ID: 131ac32a2ae6
+Revises: 5c2a108d3548
+Create Date: 2026-10-16 10:01:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import context
+
+from migration import functions
+from migration import triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = "131ac32a2ae6"
+down_revision: Union[str, None] = "5c2a108d3548"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_ALL_TABLE_NAMES = ["fot_task", "fot_table_stat"]
+
+
+def upgrade() -> None:
+    schema_upgrades()
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_upgrades()
+
+    return
+
+
+def downgrade() -> None:
+    if context.get_x_argument(as_dictionary=True).get("data", None):
+        data_downgrades()
+    schema_downgrades()
+
+    return
+
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+
+    ## Application already generates IDs, skip function call for rows with ID:
+    functions.create_fn_generate_pk()
+    triggers.drop_tr_generate_pk(table_names=_ALL_TABLE_NAMES)
+    triggers.create_tr_generate_pk(table_names=_ALL_TABLE_NAMES, only_missing_id=True)
+
+    return
+
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+
+    triggers.drop_tr_generate_pk(table_names=_ALL_TABLE_NAMES)
+    triggers.create_tr_generate_pk(table_names=_ALL_TABLE_NAMES)
+
+    return
+
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+    return
+
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
+
+    return
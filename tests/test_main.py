@@ -11,3 +11,98 @@ client = TestClient(app)
 def test_read_main():
     _response = client.get("/api/v1/ping")
     assert _response.status_code == 200
+
+
+def test_import_orm_mixins():
+    from api.config import config
+    from api.core.models.mixins.async_ import _create as _async_create
+    from api.core.models.mixins.sync import _create as _sync_create
+
+    assert _async_create._DIALECT == config.db.dialect
+    assert _sync_create._DIALECT == config.db.dialect
+
+
+def test_pipeline_rejects_returning():
+    import asyncio
+    from unittest.mock import MagicMock
+
+    import pytest
+    from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from api.core.models.mixins.sync._create import _PIPELINE_INFO_KEY
+    from api.resources.task.model import TaskORM
+
+    ## Returned rows arrive only at pipeline sync, so it must fail before execute:
+    _session = MagicMock(spec=Session)
+    _session.info = {_PIPELINE_INFO_KEY: True}
+    with pytest.raises(ValueError):
+        TaskORM.insert(session=_session, returning=True, name="task")
+    with pytest.raises(ValueError):
+        TaskORM.upsert(session=_session, orm_way=True, name="task")
+    _session.execute.assert_not_called()
+
+    _async_session = MagicMock(spec=AsyncSession)
+    _async_session.info = {_PIPELINE_INFO_KEY: True}
+    with pytest.raises(ValueError):
+        asyncio.run(
+            TaskORM.async_insert(
+                async_session=_async_session, returning=True, name="task"
+            )
+        )
+    _async_session.execute.assert_not_called()
+
+
+def test_bulk_insert_copy_matches_insert():
+    import pytest
+    from sqlalchemy import inspect, select
+
+    from api.config import config
+    from api.databases.rdb import make_engine, create_session_maker
+    from api.databases.rdb import is_db_connectable
+    from api.resources.task.model import TaskORM
+
+    if config.db.dialect != "postgresql":
+        pytest.skip("`COPY` is only used on PostgreSQL.")
+
+    _engine = make_engine(dsn_url=config.db.dsn_url, short_lived=True)
+    if (not is_db_connectable(engine=_engine)) or (
+        not inspect(_engine).has_table(TaskORM.__tablename__)
+    ):
+        pytest.skip("PostgreSQL database with task table is not available.")
+
+    ## Python side `point` default is only applied by `INSERT`, so `COPY` isn't used:
+    from api.core.models.mixins.sync._create import _is_copy_compatible
+
+    assert not _is_copy_compatible(TaskORM, ("id", "name"), _engine.dialect)
+    assert _is_copy_compatible(TaskORM, ("id", "name", "point"), _engine.dialect)
+
+    _Session = create_session_maker(engine=_engine)
+    _session = _Session()
+    try:
+        _results = {}
+        for _prefix, _use_copy in (("copy", True), ("insert", False)):
+            TaskORM.bulk_insert(
+                session=_session,
+                raw_data=[
+                    {"name": f"test_{_prefix}_{_i}", "point": _i} for _i in range(10)
+                ],
+                use_copy=_use_copy,
+            )
+            _tasks = _session.scalars(
+                select(TaskORM)
+                .where(TaskORM.name.startswith(f"test_{_prefix}_"))
+                .order_by(TaskORM.point)
+            ).all()
+            _results[_prefix] = [
+                (_task.name.split("_", 2)[2], _task.point, _task.id[:3])
+                for _task in _tasks
+            ]
+            assert all(_task.created_at and _task.updated_at for _task in _tasks)
+
+        assert _results["copy"] == _results["insert"]
+        assert len(_results["copy"]) == 10
+    finally:
+        _session.rollback()
+        _session.close()
+        _engine.dispose()